@@ -2,136 +2,491 @@
 eulerdriver
 automates solution to Project Euler
 """
+import io
 import os
+import re
+import sys
+import atexit
 import time
 import logging
+import logging.handlers
 import random
 import base64
+import bisect
+import functools
 import threading
-from typing import Optional, Dict, List, Tuple
+import queue
+import shutil
+import zipfile
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Tuple, Callable, Any
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     WebDriverException,
     ElementClickInterceptedException
 )
+from html.parser import HTMLParser
 from dotenv import load_dotenv
+import requests
+from PIL import Image
 import openai
 
 # load environment variables
 load_dotenv()
 
+# module logger, configured once so repeated instances don't stack handlers;
+# records go through a queue so file and console writes happen on a background thread
+_logger = logging.getLogger(__name__)
+if not _logger.handlers:
+    _log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    _file_handler = logging.FileHandler('euler_webdriver.log', encoding='utf-8', delay=True)
+    _file_handler.setFormatter(_log_formatter)
+    _stream_handler = logging.StreamHandler()
+    _stream_handler.setFormatter(_log_formatter)
+    _log_queue: queue.Queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, _stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # drains anything still queued
+    _logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _logger.setLevel(logging.INFO)
+    _logger.propagate = False
+
+def _max_concurrent_submits(default: int = 2) -> int:
+    """EULER_MAX_CONCURRENT_SUBMITS as a positive int, falling back to default when unusable"""
+    value = os.getenv('EULER_MAX_CONCURRENT_SUBMITS', str(default))
+    try:
+        limit = int(value)
+    except ValueError:
+        _logger.warning(f"Ignoring non-integer EULER_MAX_CONCURRENT_SUBMITS={value!r}, using {default}")
+        return default
+    # zero or less would block every submission forever
+    return max(1, limit)
+
+# caps answer submissions in flight at once across all driver instances
+_SUBMIT_SEM = threading.BoundedSemaphore(_max_concurrent_submits())
+
+# console line reader shared by _timed_input calls
+_input_lines: queue.Queue = queue.Queue()
+_input_reader: Optional[threading.Thread] = None
+
+# element lookups, each joined into a single css/xpath union so one call covers every candidate
+_ANSWER_CSS = ", ".join([
+    "input[name='answer']",
+    "#answer",
+    "textarea[name='answer']"
+])
+_SUBMIT_CSS = ", ".join([
+    "input[type='submit']",
+    "button[type='submit']",
+    "input[value='Submit']"
+])
+# only tried when _SUBMIT_CSS finds nothing, in this order
+_SUBMIT_TEXT_XPATH = "//button[contains(text(), 'Submit')]"
+_SUBMIT_UNTYPED_CSS = "form button:not([type])"  # buttons without a type submit their form
+_REMEMBER_ME_CSS = ", ".join([
+    "input[type='checkbox'][name*='remember']",
+    "input[type='checkbox'][id*='remember']",
+    "input[type='checkbox'][class*='remember']"
+])
+# unions match in document order, so the generic fallbacks are kept in their own
+# lookup that only runs when none of the named selectors match
+_LOGIN_BUTTON_XPATH = " | ".join([
+    "//input[@name='sign_in']",
+    "//input[@type='submit' and @value='Sign In']",
+    "//input[@value='Sign In']",
+    "//input[@value='Login']",
+    "//button[contains(text(), 'Sign In')]",
+    "//button[contains(text(), 'Login')]"
+])
+_LOGIN_BUTTON_FALLBACK_XPATH = "//input[@type='submit'] | //button[@type='submit']"
+_CAPTCHA_INPUT_XPATH = " | ".join([
+    "//input[contains(@name, 'captcha')]",
+    "//input[contains(@id, 'captcha')]",
+    "//input[contains(@class, 'captcha')]"
+])
+_CAPTCHA_INPUT_FALLBACK_XPATH = "//input[@type='text'][following-sibling::img or preceding-sibling::img]"
+# img-only and case-insensitive so decorative elements never match
+_CAPTCHA_IMG_CSS = ", ".join([
+    "img#captcha_image",
+    "img[id*='captcha' i]",
+    "img[src*='captcha' i]",
+    "img[alt*='captcha' i]",
+    "img[class*='captcha' i]"
+])
+
+# messages shown on the login page when the captcha answer was rejected
+_CAPTCHA_ERROR_MESSAGES = [
+    "The confirmation code you entered was not valid",
+    "You did not enter the confirmation code",
+    "Invalid confirmation code",
+    "Captcha verification failed"
+]
+
+# any of the phrases Project Euler uses when throttling submissions
+_RATE_LIMIT_RE = re.compile(
+    r'rate limit|too many|please wait|try again later|slow down|you must wait|'
+    r'before submitting any more answers',
+    re.IGNORECASE
+)
+
+# problem number in a problem page url, e.g. ".../problem=42"
+_PROBLEM_NUM_RE = re.compile(r'problem=(\d+)')
+
+# submission verdict phrases and the result message reported for each
+_RESULT_RE = re.compile(r'(congratulations|incorrect|already solved)', re.IGNORECASE)
+_RESULT_MESSAGES = {
+    'congratulations': "Correct! Congratulations!",
+    'incorrect': "Incorrect answer",
+    'already solved': "Problem already solved",
+}
+
+# rate limit wait time patterns, tried in this order: "X minute(s), Y second(s)", "X second(s)", "X minute(s)"
+_MINUTE_SECOND_RE = re.compile(r'(\d+)\s+minutes?,?\s+(\d+)\s+seconds?', re.IGNORECASE)
+_SECOND_ONLY_RE = re.compile(r'(\d+)\s+seconds?', re.IGNORECASE)
+_MINUTE_ONLY_RE = re.compile(r'(\d+)\s+minutes?', re.IGNORECASE)
+
+def _problem_number(url: str) -> Optional[int]:
+    """problem number from a problem=N link or url, or None"""
+    # plain "problem=N" hrefs are by far the most common, so read those without the regex
+    _, sep, tail = url.rpartition('problem=')
+    if not sep:
+        return None
+    number = tail.split('&', 1)[0].split('#', 1)[0]
+    if number.isascii() and number.isdigit():
+        return int(number)
+    match = _PROBLEM_NUM_RE.search(url)
+    return int(match.group(1)) if match else None
+
+@functools.lru_cache(maxsize=16)
+def _backoff_schedule(base: float, cap: float, retries: int) -> Tuple[float, ...]:
+    """upper bound of the jittered sleep before each retry, computed once per configuration"""
+    return tuple(min(cap, base * (2 ** attempt)) for attempt in range(retries))
+
+def _brave_major_version(brave_path: str) -> Optional[int]:
+    """chromium major version of a Brave install, read from its versioned folder, or None"""
+    # brave keeps its files in Application/<chromium major>.<brave version>, e.g. 131.1.73.91
+    try:
+        versions = [name for name in os.listdir(os.path.dirname(brave_path))
+                    if re.fullmatch(r'\d+(?:\.\d+){3}', name)]
+    except OSError:
+        return None
+    if not versions:
+        return None
+    return max(int(name.split('.', 1)[0]) for name in versions)
+
+@functools.lru_cache(maxsize=1)
+def _brave_paths() -> Tuple[str, ...]:
+    """candidate Brave install locations, in lookup order"""
+    user = os.environ.get('USERNAME', '')
+    return (
+        r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
+        r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
+        rf"C:\Users\{user}\AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe",
+    )
+
+def _timed_input(prompt: str, timeout: float) -> Optional[str]:
+    """
+    read a line from the console, giving up after timeout seconds
+    
+    the read happens on a daemon thread so it works on windows consoles too,
+    where select() can't wait on stdin; a read left over from a timed out prompt
+    is reused instead of starting a second one
+    
+    args:
+        prompt: Text shown before reading
+        timeout: Seconds to wait for input
+        
+    returns:
+        Optional[str]: Stripped input, or None on timeout or closed stdin
+    """
+    global _input_reader
+    
+    def read() -> None:
+        try:
+            _input_lines.put(sys.stdin.readline())
+        except Exception:
+            _input_lines.put('')
+    
+    # drop a line typed for an earlier prompt that already gave up
+    while not _input_lines.empty():
+        _input_lines.get_nowait()
+    
+    print(prompt, end='', flush=True)
+    if _input_reader is None or not _input_reader.is_alive():
+        _input_reader = threading.Thread(target=read, daemon=True)
+        _input_reader.start()
+    
+    try:
+        line = _input_lines.get(timeout=timeout)
+    except queue.Empty:
+        print()
+        return None
+    return line.strip() if line else None
+
+class _ProgressParser(HTMLParser):
+    """collects problem links from progress page html, classified by their parent element"""
+    
+    # elements that never get an end tag, so they are never someone's open parent
+    _VOID_TAGS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                            'link', 'meta', 'source', 'track', 'wbr'})
+    
+    def __init__(self):
+        super().__init__()
+        self.progress: Dict[int, bool] = {}
+        self._open: List[Tuple[str, str, str]] = []  # (tag, class, style) of open elements
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'a' and self._open:
+            number = _problem_number(attrs.get('href') or '')
+            if number is not None and number not in self.progress:
+                # same rules as the in-browser scan, which looks at a.parentElement
+                _, cls, style = self._open[-1]
+                self.progress[number] = 'problem_unsolved' not in cls and (
+                    'problem_solved' in cls or 'rgb(255, 186, 0)' in style or 'orange' in style.lower())
+        if tag not in self._VOID_TAGS:
+            self._open.append((tag, attrs.get('class') or '', attrs.get('style') or ''))
+    
+    def handle_startendtag(self, tag, attrs):
+        # a self-closed element is never open, so only its link (if any) matters
+        self.handle_starttag(tag, attrs)
+        if tag not in self._VOID_TAGS:
+            self._open.pop()
+    
+    def handle_endtag(self, tag):
+        # close back to the matching element, dropping any left unclosed inside it
+        for i in range(len(self._open) - 1, -1, -1):
+            if self._open[i][0] == tag:
+                del self._open[i:]
+                return
+
 class EulerWebdriver:
     """webdriver for automation"""
     
-    def __init__(self, headless: bool = False, action_delay: float = 1.0, max_retries: int = 3):
+    # proactive cap on answer submissions per rolling minute; the window is shared by every
+    # instance since pooled drivers all submit for the same account
+    SUBMITS_PER_MIN = 30
+    _submit_times: deque = deque()  # monotonic start times of recent submissions
+    _submit_lock = threading.Lock()
+    
+    # process-wide instance handed out by shared()
+    _shared: Optional['EulerWebdriver'] = None
+    _shared_lock = threading.Lock()
+    _shared_atexit = False
+    
+    # brave and chromedriver locations are fixed per machine, so every instance shares them
+    _brave_path: Optional[str] = None
+    _chromedriver_path: Optional[str] = None
+    _setup_lock = threading.Lock()
+    
+    # circuit breaker for OpenAI captcha solving: after this many failed captchas in a row
+    # skip straight to manual input until the cooldown passes
+    OPENAI_BREAKER_THRESHOLD = 3
+    OPENAI_BREAKER_RESET = 60.0
+    _openai_failures = 0
+    _openai_paused_until = 0.0
+    _openai_lock = threading.Lock()
+    
+    def __init__(self, headless: bool = False, action_delay: float = 1.0, max_retries: int = 3,
+                 simulate_typing: bool = False, simulate_human: Optional[bool] = None,
+                 stealth: bool = False, profile_dir: Optional[str] = None):
         """Initialize webdriver with settings"""
         self.headless = headless
         self.action_delay = action_delay
         self.max_retries = max_retries
+        # exponential backoff between retries, randomized so parallel browsers don't retry in step
+        self.retry_base_delay = 0.25
+        self.retry_max_delay = 4.0
+        self.simulate_typing = simulate_typing
+        
+        # human-like pauses default to on for visible browsers only; action_delay=0 turns them off
+        if simulate_human is None:
+            simulate_human = not headless
+        self.simulate_human = simulate_human and action_delay > 0
+        # also pause after clicks and page loads, not just around login and captcha
+        self.stealth = stealth
         self.driver = None
         self.wait = None
+        self.poll_frequency = 0.1
         self.is_logged_in = False
         
         # captcha settings
         self.captcha_dir = os.path.join(os.getcwd(), "captcha")
         os.makedirs(self.captcha_dir, exist_ok=True)
         self.captcha_cleanup_timer = None
+        self.debug_captcha = False  # keep every captcha screenshot on disk
+        self.captcha_votes = 3  # parallel OpenAI readings per captcha, majority wins
+        self.captcha_upload_size = (200, 80)  # max width/height sent to OpenAI
+        self.manual_captcha_timeout = 60  # seconds to wait for typed captcha before giving up
         
-        # logging setup
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('euler_webdriver.log', encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        # browser/driver settings
+        # persistent profile so the session cookie survives restarts
+        self.profile_dir = profile_dir or os.path.join(os.getcwd(), "brave_profile")
+        self.chromedriver_version_ttl = 24 * 60 * 60  # re-check latest version once a day
+        
+        # logging (handlers are attached once at import)
+        self.logger = _logger
         
         # urls
         self.base_url = "https://projecteuler.net"
         self.login_url = f"{self.base_url}/sign_in"
         self.problems_url = f"{self.base_url}/archives"
         self.progress_url = f"{self.base_url}/progress"
+        self.session_cookie_names = {'keep_alive', 'PHPSESSID'}
+        self.auth_cookie_names = {'keep_alive'}  # only present for a logged-in account
+        self._trust_auth_cookie = True  # cleared once the cookie turns out to be stale
+        
+        # parsed progress page (problem number -> solved), shared by the progress getters
+        self._progress_cache: Optional[Dict[int, bool]] = None
+        self._progress_cache_ts = 0.0
+        self.progress_cache_ttl = 300
+        
+        # fetch the progress page with requests instead of a browser page load when possible
+        self.fetch_progress_over_http = True
+        self._http: Optional[requests.Session] = None
+        
+        # resources skipped while loading the progress page (captcha pages are never blocked)
+        self.block_progress_resources = True
+        self.blocked_resource_patterns = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.woff", "*.woff2", "*.ico"]
+        # never needed on any page; images stay allowed elsewhere since the captcha is one
+        self.always_blocked_patterns = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm"]
+        
+        # created on the first captcha, then reused
+        self._openai: Optional[openai.OpenAI] = None
+        
+        # answer/submit elements found on the current page, dropped when the url changes
+        self._locator_cache: Dict[str, object] = {}
+        self._locator_cache_url: Optional[str] = None
         
     def _find_brave_executable(self) -> str:
         """Find Brave browser executable"""
-        possible_paths = [
-            r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
-            r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
-            r"C:\Users\{}\AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe".format(os.getenv('USERNAME')),
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                self.logger.info(f"Found Brave at: {path}")
-                return path
+        cls = type(self)
+        with cls._setup_lock:
+            if cls._brave_path:
+                return cls._brave_path
+            
+            for path in _brave_paths():
+                if os.path.exists(path):
+                    self.logger.info(f"Found Brave at: {path}")
+                    cls._brave_path = path
+                    return path
         
         raise FileNotFoundError("Brave browser not found. Please install Brave or check the path.")
     
     def _download_chromedriver(self) -> str:
-        """Download ChromeDriver if needed"""
-        import requests
-        import zipfile
-        import shutil
-        
-        # latest ver
-        try:
-            response = requests.get("https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_STABLE")
-            version = response.text.strip()
-            download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{version}/win32/chromedriver-win32.zip"
-        except:
-            # old api fallback
-            try:
-                response = requests.get("https://chromedriver.storage.googleapis.com/LATEST_RELEASE")
-                version = response.text.strip()
-                download_url = f"https://chromedriver.storage.googleapis.com/{version}/chromedriver_win32.zip"
-            except:
-                # final fallback
-                version = "114.0.5735.90"
-                download_url = f"https://chromedriver.storage.googleapis.com/{version}/chromedriver_win32.zip"
-                self.logger.warning(f"Using fallback version: {version}")
-        
+        """Download ChromeDriver if needed, once per process"""
+        cls = type(self)
+        # the lock also keeps pool drivers from downloading into the same folder at once
+        with cls._setup_lock:
+            if cls._chromedriver_path is None or not os.path.exists(cls._chromedriver_path):
+                cls._chromedriver_path = self._resolve_chromedriver()
+            return cls._chromedriver_path
+    
+    def _resolve_chromedriver(self) -> str:
+        """Find a ChromeDriver matching the installed Brave, downloading it if needed"""
         # create temp directory
         temp_dir = os.path.join(os.getcwd(), "chromedriver_temp")
         os.makedirs(temp_dir, exist_ok=True)
         chromedriver_path = os.path.join(temp_dir, "chromedriver.exe")
+        version_path = os.path.join(temp_dir, "chromedriver_version.txt")
+        have_driver = os.path.exists(chromedriver_path)
+        
+        # skip the version check entirely while the cached driver is fresh
+        if have_driver and os.path.exists(version_path):
+            age = time.time() - os.path.getmtime(version_path)
+            if age < self.chromedriver_version_ttl:
+                return chromedriver_path
         
-        if not os.path.exists(chromedriver_path):
-            self.logger.info("Downloading ChromeDriver...")
+        cached_version = None
+        if os.path.exists(version_path):
+            with open(version_path, 'r', encoding='utf-8') as f:
+                cached_version = f.read().strip()
+        
+        # the driver has to match brave's chromium major version, not the newest chrome
+        brave_major = _brave_major_version(type(self)._brave_path or '')
+        if brave_major is None and have_driver:
+            self.logger.info("Could not read the Brave version, keeping the cached ChromeDriver")
+            return chromedriver_path
+        
+        # one keep-alive session for the version check and the download
+        with requests.Session() as session:
+            session.headers['User-Agent'] = 'eulerdriver'
+            
+            version = None
             try:
-                response = requests.get(download_url)
+                release = f"LATEST_RELEASE_{brave_major}" if brave_major else "LATEST_RELEASE_STABLE"
+                response = session.get(f"https://googlechromelabs.github.io/chrome-for-testing/{release}", timeout=5)
                 response.raise_for_status()
-                
-                # save and extract
-                zip_path = os.path.join(temp_dir, "chromedriver.zip")
-                with open(zip_path, 'wb') as f:
-                    f.write(response.content)
-                
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-                
-                # new api structure
-                if "chrome-for-testing" in download_url:
-                    extracted_dir = os.path.join(temp_dir, "chromedriver-win32")
-                    if os.path.exists(extracted_dir):
-                        chromedriver_src = os.path.join(extracted_dir, "chromedriver.exe")
-                        if os.path.exists(chromedriver_src):
-                            shutil.move(chromedriver_src, chromedriver_path)
-                        shutil.rmtree(extracted_dir)
-                
-                os.remove(zip_path)
-                self.logger.info("ChromeDriver downloaded successfully")
-                
+                version = response.text.strip()
+                download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{version}/win32/chromedriver-win32.zip"
             except Exception as e:
-                self.logger.error(f"Failed to download ChromeDriver: {e}")
-                raise
+                self.logger.warning(f"Could not check ChromeDriver version: {e}")
+            
+            if not version:
+                # keep using the cached driver rather than guessing a version
+                if have_driver:
+                    self.logger.warning("Could not check latest ChromeDriver version, using cached driver")
+                    # restart the ttl so offline starts don't hit the timeout every time
+                    if os.path.exists(version_path):
+                        os.utime(version_path, None)
+                    return chromedriver_path
+                
+                # final fallback
+                version = "114.0.5735.90"
+                download_url = f"https://chromedriver.storage.googleapis.com/{version}/chromedriver_win32.zip"
+                self.logger.warning(f"Using fallback version: {version}")
+            
+            # a matching cached driver only needs its ttl restarted below
+            if not (have_driver and cached_version == version):
+                if have_driver:
+                    self.logger.info(f"ChromeDriver {cached_version or 'unknown'} does not match, updating to {version}...")
+                self.logger.info("Downloading ChromeDriver...")
+                try:
+                    # stream into memory and extract from there, no temporary zip on disk
+                    buffer = io.BytesIO()
+                    with session.get(download_url, stream=True, timeout=30) as response:
+                        response.raise_for_status()
+                        for chunk in response.iter_content(65536):
+                            buffer.write(chunk)
+                    buffer.seek(0)
+                    
+                    if not zipfile.is_zipfile(buffer):
+                        raise zipfile.BadZipFile(f"Downloaded file from {download_url} is not a valid zip")
+                    buffer.seek(0)
+                    
+                    # pull out just the executable, whichever folder the archive nests it in;
+                    # write it beside the old one and swap only once it is complete
+                    partial_path = chromedriver_path + ".part"
+                    with zipfile.ZipFile(buffer) as zip_ref:
+                        member = next((n for n in zip_ref.namelist()
+                                       if os.path.basename(n) == "chromedriver.exe"), None)
+                        if member is None:
+                            raise FileNotFoundError(f"chromedriver.exe not found in {download_url}")
+                        with zip_ref.open(member) as src, open(partial_path, 'wb') as dst:
+                            shutil.copyfileobj(src, dst)
+                    os.replace(partial_path, chromedriver_path)
+                    
+                    self.logger.info("ChromeDriver downloaded successfully")
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to download ChromeDriver: {e}")
+                    if have_driver:
+                        self.logger.warning("Keeping the previous ChromeDriver")
+                        return chromedriver_path
+                    raise
+        
+        # remember the resolved version (mtime doubles as the last check time)
+        with open(version_path, 'w', encoding='utf-8') as f:
+            f.write(version)
         
         return chromedriver_path
     
@@ -152,6 +507,14 @@ class EulerWebdriver:
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-blink-features=AutomationControlled')
+            options.add_argument('--disable-features=IsolateOrigins,site-per-process')
+            
+            # reuse the same profile between runs to stay logged in
+            options.add_argument(f'--user-data-dir={self.profile_dir}')
+            options.add_argument('--profile-directory=Default')
+            
+            # return from driver.get() once the DOM is ready instead of waiting for every resource
+            options.page_load_strategy = 'eager'
             
             # custom user agent if provided
             user_agent = os.getenv('USER_AGENT')
@@ -162,15 +525,21 @@ class EulerWebdriver:
             chromedriver_path = self._download_chromedriver()
             
             # create service and driver
-            from selenium.webdriver.chrome.service import Service
             service = Service(chromedriver_path)
             self.driver = webdriver.Chrome(service=service, options=options)
             
-            # remove webdriver property for stealth
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # stealth patches, injected before any page script runs on every new document
+            stealth_js = (
+                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+            )
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": stealth_js})
+            
+            # network domain is needed for resource blocking; fonts and media are skipped everywhere
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self._set_resource_blocking(False)
             
-            # setup wait
-            self.wait = WebDriverWait(self.driver, 10)
+            # setup wait (poll every 100ms instead of the 500ms default)
+            self.wait = WebDriverWait(self.driver, 10, poll_frequency=self.poll_frequency)
             
             self.logger.info("Brave webdriver setup completed")
             
@@ -180,6 +549,9 @@ class EulerWebdriver:
     
     def _human_delay(self, min_delay: float = None, max_delay: float = None) -> None:
         """Add human-like delay between actions"""
+        if not self.simulate_human:
+            return
+        
         if min_delay is None:
             min_delay = self.action_delay * 0.5
         if max_delay is None:
@@ -188,37 +560,60 @@ class EulerWebdriver:
         delay = random.uniform(min_delay, max_delay)
         time.sleep(delay)
     
-    def _safe_click(self, element, retries: int = None) -> bool:
-        """Safely click an element with retries"""
+    def _retry_backoff(self, attempt: int, retries: int) -> None:
+        """sleep before retry number attempt + 1 (full jitter, capped at retry_max_delay)"""
+        schedule = _backoff_schedule(self.retry_base_delay, self.retry_max_delay, retries)
+        time.sleep(random.uniform(0, schedule[attempt]))
+    
+    def _safe_click(self, element, retries: int = None, prefer_js: bool = False) -> bool:
+        """Safely click an element with retries, optionally going straight to a JS click"""
         if retries is None:
             retries = self.max_retries
+        
+        # nothing can overlay the element in headless mode, so skip the native click attempt
+        if prefer_js or self.headless:
+            try:
+                self.driver.execute_script("arguments[0].click();", element)
+                if self.stealth:
+                    self._human_delay()
+                return True
+            except Exception as e:
+                self.logger.warning(f"JavaScript click failed, falling back to native click: {e}")
             
         for attempt in range(retries):
             try:
                 # scroll element into view
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                self._human_delay(0.1, 0.3)
+                if self.stealth:
+                    self._human_delay(0.1, 0.3)
                 
                 # try regular click first
                 element.click()
-                self._human_delay()
+                if self.stealth:
+                    self._human_delay()
                 return True
                 
             except ElementClickInterceptedException:
                 try:
                     # try javascript click if regular click fails
                     self.driver.execute_script("arguments[0].click();", element)
-                    self._human_delay()
+                    if self.stealth:
+                        self._human_delay()
                     return True
                 except Exception as e:
                     self.logger.warning(f"Click attempt {attempt + 1} failed: {e}")
                     if attempt < retries - 1:
-                        self._human_delay(1, 2)
+                        self._retry_backoff(attempt, retries)
                         
-            except Exception as e:
+            except WebDriverException as e:
                 self.logger.warning(f"Click attempt {attempt + 1} failed: {e}")
                 if attempt < retries - 1:
-                    self._human_delay(1, 2)
+                    self._retry_backoff(attempt, retries)
+            
+            except Exception as e:
+                # not a browser hiccup, retrying won't help
+                self.logger.error(f"Click failed: {e}")
+                return False
         
         return False
     
@@ -226,12 +621,17 @@ class EulerWebdriver:
         """Safely send keys to an element"""
         try:
             element.clear()
-            self._human_delay(0.1, 0.2)
             
-            # type with human-like delays
-            for char in text:
-                element.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+            if self.simulate_typing:
+                # type with human-like delays (one round trip per character)
+                self._human_delay(0.1, 0.2)
+                for char in text:
+                    element.send_keys(char)
+                    if self.simulate_human:
+                        time.sleep(random.uniform(0.05, 0.15))
+            else:
+                # send the whole string in a single round trip
+                element.send_keys(text)
             
             self._human_delay()
             return True
@@ -240,7 +640,7 @@ class EulerWebdriver:
             self.logger.error(f"Failed to send keys: {e}")
             return False
     
-    def _screenshot_captcha_element(self, captcha_element) -> Optional[str]:
+    def _screenshot_captcha_element(self, captcha_element) -> Optional[bytes]:
         """
         Take a screenshot of the captcha element to capture the EXACT currently displayed captcha
         
@@ -248,7 +648,7 @@ class EulerWebdriver:
             captcha_element: The captcha image element
             
         returns:
-            Optional[str]: Path to screenshot image or None if failed
+            Optional[bytes]: PNG bytes of the screenshot or None if failed
         """
         try:
             # verify element is still valid and visible
@@ -260,43 +660,83 @@ class EulerWebdriver:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", captcha_element)
             self._human_delay(0.2, 0.3)  # slightly longer delay to ensure rendering
             
-            # get element dimensions before screenshot
+            # eager page loads can hand us the element before the image itself has arrived
+            try:
+                self.wait.until(lambda d: d.execute_script(
+                    "return arguments[0].complete && arguments[0].naturalWidth > 0;", captcha_element))
+            except TimeoutException:
+                self.logger.warning("Captcha image did not finish loading")
+            
+            # get element position (page coordinates) and dimensions in one call
+            rect = None
             try:
-                size = captcha_element.size
-                location = captcha_element.location
-                self.logger.info(f"Captcha element dimensions: {size}, location: {location}")
+                rect = self.driver.execute_script("""
+                    const r = arguments[0].getBoundingClientRect();
+                    return [r.left + window.scrollX, r.top + window.scrollY, r.width, r.height];
+                """, captcha_element)
+                self.logger.info(f"Captcha element dimensions: {{'width': {rect[2]}, 'height': {rect[3]}}}, "
+                                 f"location: {{'x': {rect[0]}, 'y': {rect[1]}}}")
                 
                 # check if element has reasonable size
-                if size['width'] < 50 or size['height'] < 20:
-                    self.logger.warning(f"Captcha element seems too small: {size}")
+                if rect[2] < 50 or rect[3] < 20:
+                    self.logger.warning(f"Captcha element seems too small: {rect[2]}x{rect[3]}")
                     return None
                     
             except Exception as e:
                 self.logger.warning(f"Could not get element dimensions: {e}")
             
-            # take screenshot of the specific element
-            screenshot = captcha_element.screenshot_as_png
+            # one cdp call crops the page to the element; fall back to selenium's element screenshot
+            screenshot = None
+            if rect:
+                try:
+                    clip = {"x": rect[0], "y": rect[1], "width": rect[2], "height": rect[3], "scale": 1}
+                    result = self.driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "png", "clip": clip})
+                    screenshot = base64.b64decode(result['data'])
+                except Exception as e:
+                    self.logger.debug("CDP screenshot failed, using element screenshot: %s", e)
+            if screenshot is None:
+                screenshot = captcha_element.screenshot_as_png
             
             # verify we got a valid screenshot
             if len(screenshot) < 1000:  # increased threshold for valid captcha
                 self.logger.warning(f"Screenshot too small ({len(screenshot)} bytes), might be invalid")
                 return None
             
-            # save the screenshot
+            self.logger.info(f"Captured captcha screenshot ({len(screenshot)} bytes)")
+            
+            # keep a copy on disk only when asked to
+            if self.debug_captcha:
+                self._save_captcha_image(screenshot)
+            
+            return screenshot
+            
+        except Exception as e:
+            self.logger.error(f"Failed to screenshot captcha element: {e}")
+            return None
+    
+    def _save_captcha_image(self, image_bytes: bytes) -> Optional[str]:
+        """
+        write captcha image to the captcha directory
+        
+        args:
+            image_bytes: PNG bytes of the captcha
+            
+        returns:
+            Optional[str]: Path to the saved image or None if failed
+        """
+        try:
             timestamp = int(time.time())
             filename = f"captcha_screenshot_{timestamp}.png"
             filepath = os.path.join(self.captcha_dir, filename)
             
             with open(filepath, 'wb') as f:
-                f.write(screenshot)
-            
-            self.logger.info(f"Captured captcha screenshot: {filepath} (size: {len(screenshot)} bytes)")
-            
+                f.write(image_bytes)
             
+            self.logger.info(f"Saved captcha screenshot: {filepath}")
             return filepath
             
         except Exception as e:
-            self.logger.error(f"Failed to screenshot captcha element: {e}")
+            self.logger.error(f"Failed to save captcha image: {e}")
             return None
     
     def _delete_captcha_image(self, filepath: str) -> None:
@@ -313,12 +753,26 @@ class EulerWebdriver:
         except Exception as e:
             self.logger.error(f"Failed to delete captcha image {filepath}: {e}")
     
-    def _solve_captcha_with_openai(self, image_path: str) -> Optional[str]:
+    def _openai_client(self, api_key: str) -> openai.OpenAI:
+        """
+        get the OpenAI client, creating it on first use
+        
+        args:
+            api_key: OpenAI API key
+            
+        returns:
+            openai.OpenAI: Client reused across captcha solves
+        """
+        if self._openai is None:
+            self._openai = openai.OpenAI(api_key=api_key, timeout=30)
+        return self._openai
+    
+    def _solve_captcha_with_openai(self, image_bytes: bytes) -> Optional[str]:
         """
         Solve captcha using OpenAI API
         
         args:
-            image_path: Path to the captcha image
+            image_bytes: PNG bytes of the captcha image
             
         returns:
             Optional[str]: Captcha solution or None if failed
@@ -330,14 +784,94 @@ class EulerWebdriver:
                 self.logger.warning("OpenAI API key not found in environment variables")
                 return None
             
-            # initialize OpenAI client
-            client = openai.OpenAI(api_key=api_key)
+            if self._openai_paused():
+                self.logger.warning("OpenAI captcha solving paused after repeated failures")
+                return None
+            
+            # reuse the client so its connection pool keeps the tls session warm
+            client = self._openai_client(api_key)
+            
+            # shrink to small grayscale before encoding to cut upload size and vision tokens
+            base64_image = base64.b64encode(self._prepare_captcha_image(image_bytes)).decode('utf-8')
+            
+            # ask several times in parallel and keep the most common reading
+            votes = max(1, self.captcha_votes)
+            if votes == 1:
+                readings = [self._read_captcha(client, base64_image)]
+            else:
+                with ThreadPoolExecutor(max_workers=votes) as executor:
+                    readings = list(executor.map(lambda _: self._read_captcha(client, base64_image), range(votes)))
+            
+            readings = [r for r in readings if r]
+            self._record_openai_result(bool(readings))
+            if not readings:
+                return None
+            
+            # ties go to the reading that came back first in request order
+            solution, count = Counter(readings).most_common(1)[0]
+            self.logger.info(f"OpenAI captcha solution: {solution} ({count}/{votes} votes)")
+            return solution
+            
+        except Exception as e:
+            self.logger.error(f"Failed to solve captcha with OpenAI: {e}")
+            self._record_openai_result(False)
+            return None
+    
+    @classmethod
+    def _openai_paused(cls) -> bool:
+        """whether the OpenAI breaker is open (too many recent failures)"""
+        with cls._openai_lock:
+            return time.monotonic() < cls._openai_paused_until
+    
+    @classmethod
+    def _record_openai_result(cls, ok: bool) -> None:
+        """count consecutive OpenAI failures, opening the breaker once the threshold is hit"""
+        with cls._openai_lock:
+            if ok:
+                cls._openai_failures = 0
+                return
+            cls._openai_failures += 1
+            if cls._openai_failures >= cls.OPENAI_BREAKER_THRESHOLD:
+                cls._openai_paused_until = time.monotonic() + cls.OPENAI_BREAKER_RESET
+                cls._openai_failures = 0
+                _logger.warning(f"OpenAI failed {cls.OPENAI_BREAKER_THRESHOLD} captchas in a row, "
+                                f"pausing it for {cls.OPENAI_BREAKER_RESET:.0f} seconds")
+    
+    def _prepare_captcha_image(self, image_bytes: bytes) -> bytes:
+        """
+        convert captcha to grayscale and cap its size for upload
+        
+        args:
+            image_bytes: PNG bytes of the captcha image
             
-            # encode image to base64
-            with open(image_path, 'rb') as image_file:
-                base64_image = base64.b64encode(image_file.read()).decode('utf-8')
+        returns:
+            bytes: Reduced PNG bytes, or the original bytes if conversion failed
+        """
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as img:
+                small = img.convert("L")
+            small.thumbnail(self.captcha_upload_size)
+            buffer = io.BytesIO()
+            small.save(buffer, "PNG", optimize=True)
+            reduced = buffer.getvalue()
+            self.logger.debug("Captcha image reduced from %d to %d bytes", len(image_bytes), len(reduced))
+            return reduced
+        except Exception as e:
+            self.logger.warning(f"Could not reduce captcha image, sending original: {e}")
+            return image_bytes
+    
+    def _read_captcha(self, client: openai.OpenAI, base64_image: str) -> Optional[str]:
+        """
+        ask OpenAI for a single reading of the captcha
+        
+        args:
+            client: OpenAI client
+            base64_image: Base64 encoded PNG of the captcha
             
-            # call OpenAI API
+        returns:
+            Optional[str]: Captcha text or None if the request failed
+        """
+        try:
             response = client.chat.completions.create(
                 model="gpt-5-mini",
                 messages=[
@@ -360,12 +894,10 @@ class EulerWebdriver:
             )
             
             # extract solution
-            solution = response.choices[0].message.content.strip()
-            self.logger.info(f"OpenAI captcha solution: {solution}")
-            return solution
+            return (response.choices[0].message.content or '').strip() or None
             
         except Exception as e:
-            self.logger.error(f"Failed to solve captcha with OpenAI: {e}")
+            self.logger.warning(f"OpenAI captcha request failed: {e}")
             return None
     
     def start(self) -> None:
@@ -378,8 +910,41 @@ class EulerWebdriver:
         """Stop the webdriver"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
             self.logger.info("Euler Webdriver stopped")
     
+    @classmethod
+    def shared(cls, **kwargs) -> 'EulerWebdriver':
+        """
+        get a started webdriver that is reused for the rest of the process
+        
+        scripts that run several workflows should call this instead of creating
+        a new EulerWebdriver each time, so the browser is only launched once
+        
+        args:
+            **kwargs: Constructor settings, only used when the instance is first created
+            
+        returns:
+            EulerWebdriver: The shared, started instance
+        """
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.driver is None:
+                cls._shared = cls(**kwargs)
+                cls._shared.start()
+                # one hook covers every instance the process ever creates
+                if not cls._shared_atexit:
+                    atexit.register(cls.close_shared)
+                    cls._shared_atexit = True
+            return cls._shared
+    
+    @classmethod
+    def close_shared(cls) -> None:
+        """Stop the shared webdriver if one was started"""
+        with cls._shared_lock:
+            if cls._shared is not None:
+                cls._shared.stop()
+                cls._shared = None
+    
     def __enter__(self):
         """Context manager entry"""
         self.start()
@@ -397,8 +962,20 @@ class EulerWebdriver:
             bool: True if login successful, False otherwise
         """
         try:
-            # check if already logged in (persistent session)
-            if self.check_login_status():
+            # login state is already known, nothing to do
+            if self.is_logged_in:
+                return True
+            
+            # a remember-me cookie is only issued on login, so trust it without loading a page;
+            # _load_progress_page catches one the server no longer accepts and turns this off
+            cookie_names = self._site_cookie_names() or set()
+            if self._trust_auth_cookie and cookie_names & self.auth_cookie_names:
+                self.is_logged_in = True
+                self.logger.info("Already logged in (remembered session cookie)")
+                return True
+            
+            # only spend a page load verifying the session if a session cookie exists
+            if self._has_session_cookie() and self.check_login_status():
                 self.logger.info("Already logged in (persistent session)")
                 return True
             
@@ -415,39 +992,42 @@ class EulerWebdriver:
             self.driver.get(self.login_url)
             self._human_delay(1, 2)
             
-            # find and fill username field
-            username_field = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            if not self._safe_send_keys(username_field, username):
-                self.logger.error("Failed to enter username")
-                return False
-            
-            # find and fill password field
-            password_field = self.driver.find_element(By.NAME, "password")
-            if not self._safe_send_keys(password_field, password):
-                self.logger.error("Failed to enter password")
-                return False
-            
-            # check "remember me" checkbox if present
-            try:
-                remember_me_selectors = [
-                    "//input[@type='checkbox' and contains(@name, 'remember')]",
-                    "//input[@type='checkbox' and contains(@id, 'remember')]",
-                    "//input[@type='checkbox' and contains(@class, 'remember')]"
-                ]
+            # block until the browser reports the page loaded, in a single round trip
+            self.driver.execute_async_script("""
+                const done = arguments[arguments.length - 1];
+                if (document.readyState === 'complete') return done();
+                window.addEventListener('load', () => done(), {once: true});
+            """)
+            
+            # without typing simulation, fill both fields and tick remember me in one round trip
+            filled = False
+            if not self.simulate_typing:
+                filled = self._fill_login_form_js(username, password, _REMEMBER_ME_CSS)
+            
+            if not filled:
+                # find and fill username field
+                username_field = self.driver.find_element(By.NAME, "username")
+                if not self._safe_send_keys(username_field, username):
+                    self.logger.error("Failed to enter username")
+                    return False
                 
-                for selector in remember_me_selectors:
-                    try:
-                        remember_checkbox = self.driver.find_element(By.XPATH, selector)
+                # find and fill password field
+                password_field = self.driver.find_element(By.NAME, "password")
+                if not self._safe_send_keys(password_field, password):
+                    self.logger.error("Failed to enter password")
+                    return False
+                
+                # check "remember me" checkbox if present
+                try:
+                    # one union lookup instead of one round trip per selector
+                    remember_checkboxes = self.driver.find_elements(By.CSS_SELECTOR, _REMEMBER_ME_CSS)
+                    if remember_checkboxes:
+                        remember_checkbox = remember_checkboxes[0]
                         if not remember_checkbox.is_selected():
                             self._safe_click(remember_checkbox)
                             self.logger.info("Checked 'Remember Me' checkbox")
-                        break
-                    except NoSuchElementException:
-                        continue
-            except Exception as e:
-                self.logger.debug(f"Could not find or check 'Remember Me' checkbox: {e}")
+                except Exception as e:
+                    self.logger.debug("Could not find or check 'Remember Me' checkbox: %s", e)
             
             # handle captcha if present (but don't check for failure yet)
             captcha_handled = self._handle_captcha_if_present(max_retries=3)
@@ -455,26 +1035,10 @@ class EulerWebdriver:
                 self.logger.error("Failed to handle captcha after retries")
                 return False
             
-            # find and click login button with multiple selectors
-            login_button = None
-            login_selectors = [
-                "//input[@name='sign_in']",
-                "//input[@type='submit' and @value='Sign In']",
-                "//input[@type='submit']",
-                "//input[@value='Sign In']",
-                "//input[@value='Login']",
-                "//button[@type='submit']",
-                "//button[contains(text(), 'Sign In')]",
-                "//button[contains(text(), 'Login')]"
-            ]
-            
-            for selector in login_selectors:
-                try:
-                    login_button = self.driver.find_element(By.XPATH, selector)
-                    self.logger.info(f"Found login button with selector: {selector}")
-                    break
-                except NoSuchElementException:
-                    continue
+            # find login button with a single union of the named selectors, then any submit button
+            login_buttons = (self.driver.find_elements(By.XPATH, _LOGIN_BUTTON_XPATH)
+                             or self.driver.find_elements(By.XPATH, _LOGIN_BUTTON_FALLBACK_XPATH))
+            login_button = login_buttons[0] if login_buttons else None
             
             if not login_button:
                 self.logger.error("Could not find login button")
@@ -484,8 +1048,15 @@ class EulerWebdriver:
                 self.logger.error("Failed to click login button")
                 return False
             
-            # wait for form submission and redirect
-            self._human_delay(1.5, 2.5)
+            # wait for the form post to replace the page (a js click returns before it navigates);
+            # the result page is either the redirect or the sign in form with an error on it
+            try:
+                WebDriverWait(self.driver, 10, poll_frequency=self.poll_frequency).until(
+                    EC.staleness_of(login_button)
+                )
+            except TimeoutException:
+                self.logger.debug("Login page did not reload after clicking sign in")
+            self._human_delay(0.5, 1.0)
             
             # check if we're redirected away from login page
             current_url = self.driver.current_url
@@ -497,46 +1068,106 @@ class EulerWebdriver:
                 # still on login page - check for specific error messages
                 error_found = False
                 
-                # check for captcha failure messages
-                captcha_error_messages = [
-                    "The confirmation code you entered was not valid",
-                    "You did not enter the confirmation code",
-                    "Invalid confirmation code",
-                    "Captcha verification failed"
-                ]
+                # check for captcha failure messages and scan the rendered text and every .error element in one round trip
+                captcha_error, error_texts = self.driver.execute_script("""
+                    const text = (document.body ? document.body.innerText : '').toLowerCase();
+                    const hit = arguments[0].find(msg => text.indexOf(msg.toLowerCase()) >= 0) || null;
+                    const errors = Array.from(document.getElementsByClassName('error'))
+                        .map(e => (e.innerText || '').trim()).filter(t => t);
+                    return [hit, errors];
+                """, _CAPTCHA_ERROR_MESSAGES)
                 
-                page_text = self.driver.page_source.lower()
-                for error_msg in captcha_error_messages:
-                    if error_msg.lower() in page_text:
-                        self.logger.error(f"Captcha failed: {error_msg}")
-                        error_found = True
-                        break
+                if captcha_error:
+                    self.logger.error(f"Captcha failed: {captcha_error}")
+                    error_found = True
                 
                 # check for general error messages
-                if not error_found:
-                    try:
-                        error_elements = self.driver.find_elements(By.CLASS_NAME, "error")
-                        for error_element in error_elements:
-                            error_text = error_element.text.strip()
-                            if error_text:
-                                self.logger.error(f"Login failed: {error_text}")
-                                error_found = True
-                                break
-                    except NoSuchElementException:
-                        pass
+                if not error_found and error_texts:
+                    self.logger.error(f"Login failed: {error_texts[0]}")
+                    error_found = True
                 
                 if not error_found:
                     self.logger.error("Login failed: Still on login page but no specific error found")
                 
                 return False
                 
-        except TimeoutException:
+        except (TimeoutException, NoSuchElementException):
             self.logger.error("Login timeout - page elements not found")
             return False
         except Exception as e:
             self.logger.error(f"Login failed with exception: {e}")
             return False
     
+    def _fill_login_form_js(self, username: str, password: str, remember_selector: str) -> bool:
+        """
+        fill the login form from inside the page
+        
+        the form is still submitted through the sign in button afterwards so the
+        request matches a normal click
+        
+        args:
+            username: Account username
+            password: Account password
+            remember_selector: CSS selector for the remember me checkbox
+            
+        returns:
+            bool: True if both fields were filled, False to fall back to send_keys
+        """
+        try:
+            filled = self.driver.execute_script("""
+                const user = document.querySelector("input[name='username']");
+                const pass = document.querySelector("input[name='password']");
+                if (!user || !pass) return false;
+                for (const [field, value] of [[user, arguments[0]], [pass, arguments[1]]]) {
+                    field.value = value;
+                    field.dispatchEvent(new Event('input', {bubbles: true}));
+                    field.dispatchEvent(new Event('change', {bubbles: true}));
+                }
+                const remember = document.querySelector(arguments[2]);
+                if (remember && !remember.checked) remember.click();
+                return true;
+            """, username, password, remember_selector)
+            if filled:
+                self.logger.info("Filled login form")
+            return bool(filled)
+        except Exception as e:
+            self.logger.debug("Scripted login fill failed, typing instead: %s", e)
+            return False
+    
+    def _site_cookie_names(self) -> Optional[set]:
+        """
+        read the names of the Project Euler cookies without navigating
+        
+        cdp sees the cookie jar for the site even before any of its pages are open,
+        unlike get_cookies which only covers the current document
+        
+        returns:
+            Optional[set]: Cookie names, or None if they could not be read
+        """
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getCookies", {"urls": [self.base_url]})
+            return {cookie.get('name') for cookie in result.get('cookies', [])}
+        except Exception:
+            pass
+        
+        try:
+            return {cookie.get('name') for cookie in self.driver.get_cookies()}
+        except Exception as e:
+            self.logger.warning(f"Could not read cookies: {e}")
+            return None
+    
+    def _has_session_cookie(self) -> bool:
+        """
+        Check the browser cookie jar for a Project Euler session cookie without navigating
+        
+        returns:
+            bool: True if a session cookie is present, False otherwise
+        """
+        cookie_names = self._site_cookie_names()
+        if cookie_names is None:
+            return True  # unknown, let the caller verify by navigating
+        return bool(cookie_names & self.session_cookie_names)
+    
     def check_login_status(self) -> bool:
         """
         Check if currently logged in to Project Euler
@@ -545,28 +1176,32 @@ class EulerWebdriver:
             bool: True if logged in, False otherwise
         """
         try:
-            # navigate to main page
-            self.driver.get(self.base_url)
-            self._human_delay(1, 2)
+            # any project euler page shows the account links, so only navigate when elsewhere
+            if not self.driver.current_url.startswith(self.base_url):
+                self.driver.get(self.base_url)
+                if self.stealth:
+                    self._human_delay(1, 2)
             
-            # look for logout link
-            try:
-                # check for logout link (indicates logged in)
-                logout_element = self.driver.find_element(By.XPATH, "//a[contains(@href, 'sign_out')]")
+            # look for the logout link (logged in) and sign in link (not logged in) together
+            status = self.driver.execute_script("""
+                if (document.querySelector("a[href*='sign_out']")) return 'out';
+                if (document.querySelector("a[href*='sign_in']")) return 'in';
+                return null;
+            """)
+            
+            if status == 'out':
                 self.is_logged_in = True
                 self.logger.info("Already logged in")
                 return True
-            except NoSuchElementException:
-                # check for sign in link (indicates not logged in)
-                try:
-                    signin_element = self.driver.find_element(By.XPATH, "//a[contains(@href, 'sign_in')]")
-                    self.is_logged_in = False
-                    self.logger.info("Not logged in")
-                    return False
-                except NoSuchElementException:
-                    # if neither found, assume logged in
-                    self.is_logged_in = True
-                    return True
+            
+            if status == 'in':
+                self.is_logged_in = False
+                self.logger.info("Not logged in")
+                return False
+            
+            # if neither found, assume logged in
+            self.is_logged_in = True
+            return True
                     
         except Exception as e:
             self.logger.error(f"Error checking login status: {e}")
@@ -588,11 +1223,11 @@ class EulerWebdriver:
             # navigate directly to the problem URL
             problem_url = f"{self.base_url}/problem={problem_number}"
             self.driver.get(problem_url)
-            self._human_delay(0.5, 1.0)
+            if self.stealth:
+                self._human_delay(0.5, 1.0)
             
             # verify we're on the correct problem page
-            current_url = self.driver.current_url
-            if str(problem_number) in current_url or f"problem={problem_number}" in current_url:
+            if _problem_number(self.driver.current_url) == problem_number:
                 self.logger.info(f"Successfully navigated to problem {problem_number}")
                 return True
             else:
@@ -603,70 +1238,234 @@ class EulerWebdriver:
             self.logger.error(f"Failed to navigate to problem {problem_number}: {e}")
             return False
     
-    def get_next_unsolved_problem(self) -> Optional[int]:
+    def _load_progress_page(self, force: bool = False) -> Dict[int, bool]:
         """
-        get the next unsolved problem from the progress page
+        load and parse the progress page, reusing the cached result while fresh
         
+        args:
+            force: Always navigate and re-parse, ignoring the cache
+            
         returns:
-            Optional[int]: Next unsolved problem number, or None if none found
+            Dict[int, bool]: Problem number -> solved flag, in page order
         """
+        if not force and self._progress_cache is not None:
+            if time.time() - self._progress_cache_ts < self.progress_cache_ttl:
+                return self._progress_cache
+        
+        # a progress page that was loaded but never parsed can be reused as-is
+        already_loaded = self._progress_cache is None and self.driver.current_url == self.progress_url
+        
+        # the page is static html, so a plain request with the browser's cookies is enough
+        if not already_loaded and self.fetch_progress_over_http:
+            progress = self._fetch_progress_http()
+            if progress:
+                self._progress_cache = progress
+                self._progress_cache_ts = time.time()
+                return progress
+        
+        if force or not already_loaded:
+            self._open_progress_page()
+        
+        # an expired or revoked remember-me cookie lands on the sign in page instead
+        if self._on_sign_in_page():
+            self.logger.warning("Saved session is no longer valid, logging in again")
+            self.is_logged_in = False
+            self._trust_auth_cookie = False
+            if not self.login():
+                raise RuntimeError("Not logged in, progress page unavailable")
+            self._open_progress_page()
+        
+        self._progress_cache = self._parse_progress()
+        self._progress_cache_ts = time.time()
+        return self._progress_cache
+    
+    def _open_progress_page(self) -> None:
+        """load the progress page in the browser"""
+        # images and fonts are irrelevant to the scrape, skip downloading them
+        self._set_resource_blocking(self.block_progress_resources)
         try:
-            self.logger.info("Finding next unsolved problem from progress page...")
-            
-            # navigate to progress page
             self.driver.get(self.progress_url)
+        finally:
+            self._set_resource_blocking(False)
+        if self.stealth:
             self._human_delay(1, 1.5)
-            
-            try:
-                # use the most efficient selector - direct td elements with problem links
-                problem_elements = self.driver.find_elements(By.XPATH, "//td[@class='tooltip problem_unsolved']//a[contains(@href, 'problem=')]")
-                
-                if not problem_elements:
-                    # fallback: look for any unsolved problem links
-                    problem_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'problem=')]")
-                
-                self.logger.info(f"Found {len(problem_elements)} problem elements, checking for first unsolved...")
-                
-                for element in problem_elements:
-                    try:
-                        # extract problem number
-                        href = element.get_attribute('href')
-                        if href and 'problem=' in href:
-                            problem_num = int(href.split('problem=')[1].split('&')[0])
-                            
-                            # check if this problem is unsolved (fast check)
-                            parent_td = element.find_element(By.XPATH, "./..")
-                            td_class = parent_td.get_attribute('class') or ''
-                            
-                            # if it has 'problem_unsolved' class, it's unsolved
-                            if 'problem_unsolved' in td_class:
-                                self.logger.info(f"Found next unsolved problem: {problem_num}")
-                                return problem_num
-                            # if it has 'problem_solved' class, skip it
-                            elif 'problem_solved' in td_class:
-                                continue
-                            # if no class info, check style for orange background
-                            else:
-                                td_style = parent_td.get_attribute('style') or ''
-                                if 'rgb(255, 186, 0)' not in td_style and 'orange' not in td_style.lower():
-                                    self.logger.info(f"Found next unsolved problem: {problem_num} (no solved styling)")
-                                    return problem_num
-                                    
-                    except Exception as e:
-                        self.logger.debug(f"Error processing problem element: {e}")
-                        continue
-                
-                self.logger.info("No unsolved problems found")
+    
+    def _on_sign_in_page(self) -> bool:
+        """whether the browser was sent to the sign in page (the session is gone)"""
+        if "sign_in" in self.driver.current_url:
+            return True
+        return bool(self.driver.execute_script(
+            "return !document.querySelector(\"a[href*='sign_out']\") && "
+            "!!document.querySelector(\"a[href*='sign_in']\");"
+        ))
+    
+    def _fetch_progress_http(self) -> Optional[Dict[int, bool]]:
+        """
+        fetch and parse the progress page without going through the browser
+        
+        returns:
+            Optional[Dict[int, bool]]: Problem number -> solved flag, or None to fall back to the browser
+        """
+        try:
+            if self._http is None:
+                self._http = requests.Session()
+                self._http.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent;")
+            
+            # copy the current session cookies, they can change on login
+            result = self.driver.execute_cdp_cmd("Network.getCookies", {"urls": [self.base_url]})
+            for cookie in result.get('cookies', []):
+                self._http.cookies.set(cookie['name'], cookie['value'],
+                                       domain=cookie.get('domain'), path=cookie.get('path', '/'))
+            
+            response = self._http.get(self.progress_url, timeout=10, allow_redirects=False)
+            if response.status_code != 200:
+                self.logger.info(f"Progress page returned {response.status_code}, loading it in the browser")
                 return None
-                
-            except Exception as e:
-                self.logger.error(f"Error parsing progress page: {e}")
+            
+            parser = _ProgressParser()
+            parser.feed(response.text)
+            parser.close()
+            if not parser.progress:
                 return None
+            
+            self.logger.info(f"Found {len(parser.progress)} problem elements on progress page")
+            return parser.progress
+            
+        except Exception as e:
+            self.logger.warning(f"Could not fetch progress page directly: {e}")
+            return None
+    
+    def _set_resource_blocking(self, enabled: bool) -> None:
+        """
+        block or unblock image/font requests via CDP
+        
+        args:
+            enabled: True to also block the progress page patterns, False to block only fonts and media
+        """
+        urls = list(self.always_blocked_patterns)
+        if enabled:
+            urls += [p for p in self.blocked_resource_patterns if p not in urls]
+        try:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+        except Exception as e:
+            self.logger.warning(f"Could not update blocked resources: {e}")
+    
+    def _scrape_progress_js(self) -> List[List]:
+        """
+        collect every problem link and its solved state in one browser-side pass
+        
+        returns:
+            List[List]: [problem_number, solved] pairs in page order
+        """
+        return self.driver.execute_script("""
+            return Array.from(document.querySelectorAll("a[href*='problem=']")).map(a => {
+                const m = a.href.match(/problem=(\\d+)/);
+                const td = a.parentElement;
+                const cls = td ? td.className || '' : '';
+                const st = td ? td.getAttribute('style') || '' : '';
+                const solved = cls.indexOf('problem_unsolved') < 0 && (
+                    cls.indexOf('problem_solved') >= 0 ||
+                    st.indexOf('rgb(255, 186, 0)') >= 0 ||
+                    st.toLowerCase().indexOf('orange') >= 0);
+                return [m ? +m[1] : null, solved];
+            });
+        """) or []
+    
+    def _parse_progress(self) -> Dict[int, bool]:
+        """
+        scan the currently loaded progress page for problem links
+        
+        returns:
+            Dict[int, bool]: Problem number -> solved flag, in page order
+        """
+        progress: Dict[int, bool] = {}
+        rows = self._scrape_progress_js()
+        self.logger.info(f"Found {len(rows)} problem elements on progress page")
+        
+        for problem_num, solved in rows:
+            if problem_num is None or problem_num in progress:
+                continue
+            progress[int(problem_num)] = bool(solved)
+        
+        return progress
+    
+    def invalidate_progress_cache(self) -> None:
+        """Forget the parsed progress page so the next lookup reloads it"""
+        self._progress_cache = None
+        self._progress_cache_ts = 0.0
+    
+    def get_solved_problems(self) -> List[int]:
+        """
+        get all solved problems from the progress page
+        
+        returns:
+            List[int]: Sorted solved problem numbers
+        """
+        try:
+            progress = self._load_progress_page()
+            return sorted(num for num, solved in progress.items() if solved)
+        except Exception as e:
+            self.logger.error(f"Error getting solved problems: {e}")
+            return []
+    
+    def get_unsolved_problems(self) -> List[int]:
+        """
+        get all unsolved problems from the progress page
+        
+        returns:
+            List[int]: Sorted unsolved problem numbers
+        """
+        try:
+            progress = self._load_progress_page()
+            return sorted(num for num, solved in progress.items() if not solved)
+        except Exception as e:
+            self.logger.error(f"Error getting unsolved problems: {e}")
+            return []
+    
+    def get_next_unsolved_problem(self, after: Optional[int] = None) -> Optional[int]:
+        """
+        get the next unsolved problem from the progress page
+        
+        args:
+            after: Only consider problems numbered above this one
+            
+        returns:
+            Optional[int]: Next unsolved problem number, or None if none found
+        """
+        try:
+            # sorted list built from the cached progress page, so the next problem
+            # is a binary search away and repeated calls don't reload the page
+            unsolved = self.get_unsolved_problems()
+            index = bisect.bisect_right(unsolved, after) if after is not None else 0
+            if index < len(unsolved):
+                problem_num = unsolved[index]
+                self.logger.info(f"Found next unsolved problem: {problem_num}")
+                return problem_num
+            
+            self.logger.info("No unsolved problems found")
+            return None
                 
         except Exception as e:
             self.logger.error(f"Error getting next unsolved problem: {e}")
             return None
     
+    def _wait_if_throttled(self) -> None:
+        """Sleep until a submission slot frees up in the shared one-minute window, then take it"""
+        cls = type(self)
+        # held while sleeping so waiting drivers take freed slots one at a time
+        with cls._submit_lock:
+            now = time.monotonic()
+            while cls._submit_times and now - cls._submit_times[0] >= 60:
+                cls._submit_times.popleft()
+            
+            if len(cls._submit_times) >= cls.SUBMITS_PER_MIN:
+                wait_seconds = 60 - (now - cls._submit_times[0])
+                self.logger.info(f"Submission throttle reached, waiting {wait_seconds:.1f} seconds...")
+                time.sleep(wait_seconds)
+                cls._submit_times.popleft()
+            
+            cls._submit_times.append(time.monotonic())
+    
     def submit_answer(self, answer: str) -> Tuple[bool, str]:
         """
         submit an answer for the current problem
@@ -677,79 +1476,130 @@ class EulerWebdriver:
         returns:
             Tuple[bool, str]: (success, message) - success indicates if submission worked, message contains result
         """
-        try:
-            self.logger.info(f"Submitting answer: {answer}")
-            
-            # check for captcha before submitting
-            captcha_handled = self._handle_captcha_if_present(max_retries=3)
-            if not captcha_handled:
-                self.logger.error("Failed to handle captcha before submission")
-                return False, "Captcha handling failed"
-            
-            # look for answer input field  
-            answer_selectors = [
-                "//input[@name='answer']",
-                "//input[@id='answer']",
-                "//input[@type='text']",
-                "//textarea[@name='answer']"
-            ]
-            
-            answer_field = None
-            for selector in answer_selectors:
+        # stay under the site's rate limit instead of reacting to it; done before taking
+        # a submission slot so a throttled driver doesn't hold one while it sleeps
+        self._wait_if_throttled()
+        
+        # cap in-flight submissions across every instance in the process
+        with _SUBMIT_SEM:
+            try:
+                self.logger.info(f"Submitting answer: {answer}")
+                
+                # check for captcha before submitting
+                captcha_handled = self._handle_captcha_if_present(max_retries=3)
+                if not captcha_handled:
+                    self.logger.error("Failed to handle captcha before submission")
+                    return False, "Captcha handling failed"
+                
+                # look for answer input field, reusing it if this page was seen before
+                answer_field = self._get_or_find('answer', self._find_answer_field)
+                if not answer_field:
+                    self.logger.error("Could not find answer input field")
+                    return False, "Answer field not found"
+                
+                # enter the answer
+                if not self._safe_send_keys(answer_field, answer):
+                    self.logger.error("Failed to enter answer")
+                    return False, "Failed to enter answer"
+                
+                # look for submit button
+                submit_button = self._get_or_find('submit', self._find_submit_button)
+                if not submit_button:
+                    self.logger.error("Could not find submit button")
+                    return False, "Submit button not found"
+                
+                # click submit button
+                if not self._safe_click(submit_button):
+                    self.logger.error("Failed to click submit button")
+                    return False, "Failed to submit answer"
+                
+                # solved state may have changed, reload progress on next lookup
+                self.invalidate_progress_cache()
+                
+                # wait for the form page to go away instead of sleeping a fixed time;
+                # the verdict itself is awaited in _check_submission_result
                 try:
-                    # use a shorter timeout for answer field lookup to reduce delay
-                    quick_wait = WebDriverWait(self.driver, 2)
-                    answer_field = quick_wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
+                    WebDriverWait(self.driver, 10, poll_frequency=self.poll_frequency).until(
+                        EC.staleness_of(submit_button)
                     )
-                    break
                 except TimeoutException:
-                    continue
-            
-            if not answer_field:
-                self.logger.error("Could not find answer input field")
-                return False, "Answer field not found"
-            
-            # enter the answer
-            if not self._safe_send_keys(answer_field, answer):
-                self.logger.error("Failed to enter answer")
-                return False, "Failed to enter answer"
-            
-            # look for submit button
-            submit_selectors = [
-                "//input[@type='submit']",
-                "//button[@type='submit']",
-                "//input[@value='Submit']",
-                "//button[contains(text(), 'Submit')]"
-            ]
-            
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    submit_button = self.driver.find_element(By.XPATH, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if not submit_button:
-                self.logger.error("Could not find submit button")
-                return False, "Submit button not found"
-            
-            # click submit button
-            if not self._safe_click(submit_button):
-                self.logger.error("Failed to click submit button")
-                return False, "Failed to submit answer"
-            
-            # wait for response
-            self._human_delay(0.5, 1.0)
-            
-            # check for result message
-            result_message = self._check_submission_result()
-            return True, result_message
+                    self.logger.debug("Submit page did not reload, checking result in place")
+                
+                # check for result message
+                result_message = self._check_submission_result()
+                return True, result_message
+                
+            except Exception as e:
+                self.logger.error(f"Failed to submit answer: {e}")
+                return False, f"Submission error: {e}"
+    
+    def _find_answer_field(self):
+        """
+        locate the answer input on the current problem page
+        
+        returns:
+            WebElement: The answer field, or None if not found
+        """
+        # use a shorter timeout for answer field lookup to reduce delay
+        quick_wait = WebDriverWait(self.driver, 4, poll_frequency=self.poll_frequency)
+        
+        # wait once for any of the answer-specific selectors; the generic text
+        # input is only a fallback since it could also match the captcha field
+        try:
+            return quick_wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _ANSWER_CSS))
+            )
+        except TimeoutException:
+            fallback_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[type='text']")
+            return fallback_fields[0] if fallback_fields else None
+    
+    def _find_submit_button(self):
+        """
+        locate the submit button on the current problem page
+        
+        returns:
+            WebElement: The submit button, or None if not found
+        """
+        # the typed/value selectors first; a union matches in document order, so the looser
+        # "Submit" text and untyped button lookups only run when those find nothing
+        submit_buttons = (self.driver.find_elements(By.CSS_SELECTOR, _SUBMIT_CSS)
+                          or self.driver.find_elements(By.XPATH, _SUBMIT_TEXT_XPATH)
+                          or self.driver.find_elements(By.CSS_SELECTOR, _SUBMIT_UNTYPED_CSS))
+        return submit_buttons[0] if submit_buttons else None
+    
+    def _get_or_find(self, key: str, finder):
+        """
+        return a cached element for the current page or locate it with finder
+        
+        the cache is dropped whenever the url changes, and a cached element that
+        went stale is looked up again
+        
+        args:
+            key: Name of the element within the page
+            finder: Callable returning the element or None
             
-        except Exception as e:
-            self.logger.error(f"Failed to submit answer: {e}")
-            return False, f"Submission error: {e}"
+        returns:
+            WebElement: The element, or None if finder found nothing
+        """
+        current_url = self.driver.current_url
+        if current_url != self._locator_cache_url:
+            self._locator_cache.clear()
+            self._locator_cache_url = current_url
+        
+        element = self._locator_cache.get(key)
+        if element is not None:
+            try:
+                if element.is_enabled():
+                    return element
+            except WebDriverException:
+                pass  # stale, find it again
+        
+        element = finder()
+        if element is not None:
+            self._locator_cache[key] = element
+        else:
+            self._locator_cache.pop(key, None)
+        return element
     
     def _check_submission_result(self) -> str:
         """
@@ -759,34 +1609,80 @@ class EulerWebdriver:
             str: Result message
         """
         try:
+            # let the browser watch for the verdict instead of pulling the whole dom
+            verdict = self._wait_for_verdict()
+            if verdict in _RESULT_MESSAGES:
+                return _RESULT_MESSAGES[verdict]
+            
+            # rate limit banners are rare, so only now fetch the page text for the wait time
+            page_text = self._get_page_text_lower()
+            
             # check for rate limiting first
-            is_limited, wait_time = self.is_rate_limited()
+            is_limited, wait_time = self.is_rate_limited(page_text=page_text)
             if is_limited:
                 if wait_time:
                     self.logger.warning(f"Rate limited after submission, need to wait {wait_time} seconds...")
                 else:
                     self.logger.warning("Rate limited after submission, refreshing page...")
-                if self.wait_for_rate_limit():
+                if self.wait_for_rate_limit(page_text=page_text):
                     return "Rate limit cleared, ready for next submission"
                 else:
                     return "Rate limited and unable to clear"
             
-            # quick check for obvious success/failure indicators
-            page_text = self.driver.page_source.lower()
-            
-            if 'correct' in page_text and 'congratulations' in page_text:
-                return "Correct! Congratulations!"
-            elif 'incorrect' in page_text:
-                return "Incorrect answer"
-            elif 'already solved' in page_text:
-                return "Problem already solved"
-            else:
-                return "Submission completed"
+            # single pass: the first verdict phrase on the page decides the result
+            match = _RESULT_RE.search(page_text)
+            verdict = match.group(1).lower() if match else ''
+            return _RESULT_MESSAGES.get(verdict, "Submission completed")
                 
         except Exception as e:
             self.logger.error(f"Error checking submission result: {e}")
             return f"Error checking result: {e}"
     
+    def _wait_for_verdict(self, timeout: float = 10.0) -> str:
+        """
+        wait in the browser until a rate limit or result phrase shows up
+        
+        a MutationObserver watches the page so only the matched phrase crosses
+        the wire instead of the serialized dom
+        
+        args:
+            timeout: Maximum time to wait in seconds
+            
+        returns:
+            str: Matched phrase in lowercase, 'timeout', or '' on error
+        """
+        verdict_js = """
+        var rateRe = new RegExp(arguments[0], 'i');
+        var resultRe = new RegExp(arguments[1], 'i');
+        var cb = arguments[arguments.length - 1];
+        var done = false;
+        var mo = null;
+        function finish(value) {
+            if (done) return;
+            done = true;
+            if (mo) mo.disconnect();
+            cb(value);
+        }
+        function scan() {
+            var text = document.body ? document.body.innerText : '';
+            var m = text.match(rateRe) || text.match(resultRe);
+            if (m) finish(m[0].toLowerCase());
+            return done;
+        }
+        if (scan()) return;
+        mo = new MutationObserver(scan);
+        mo.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+        setTimeout(function() { finish('timeout'); }, arguments[2]);
+        """
+        try:
+            verdict = self.driver.execute_async_script(
+                verdict_js, _RATE_LIMIT_RE.pattern, _RESULT_RE.pattern, int(timeout * 1000)
+            )
+            return verdict or ''
+        except Exception as e:
+            self.logger.debug("Verdict wait failed: %s", e)
+            return ''
+    
     def _parse_wait_time_from_message(self, message: str) -> Optional[int]:
         """
         Parse wait time in seconds from rate limit error message
@@ -797,15 +1693,10 @@ class EulerWebdriver:
         returns:
             Optional[int]: Wait time in seconds, or None if not found
         """
-        import re
-        
         try:
-            # convert to lowercase for case-insensitive matching
-            message_lower = message.lower()
-            
-            # pattern to match "X minute(s), Y second(s)" format
-            minute_second_pattern = r'(\d+)\s+minute(?:s)?,?\s+(\d+)\s+second(?:s)?'
-            match = re.search(minute_second_pattern, message_lower)
+            # patterns are case-insensitive, so the message is matched as-is without lowercasing
+            # match "X minute(s), Y second(s)" format
+            match = _MINUTE_SECOND_RE.search(message)
             if match:
                 minutes = int(match.group(1))
                 seconds = int(match.group(2))
@@ -813,17 +1704,15 @@ class EulerWebdriver:
                 self.logger.info(f"Parsed wait time: {minutes} minutes, {seconds} seconds = {total_seconds} total seconds")
                 return total_seconds
             
-            # pattern to match just seconds "X second(s)"
-            second_only_pattern = r'(\d+)\s+second(?:s)?'
-            match = re.search(second_only_pattern, message_lower)
+            # match just seconds "X second(s)"
+            match = _SECOND_ONLY_RE.search(message)
             if match:
                 seconds = int(match.group(1))
                 self.logger.info(f"Parsed wait time: {seconds} seconds")
                 return seconds
             
-            # pattern to match just minutes "X minute(s)" (convert to seconds)
-            minute_only_pattern = r'(\d+)\s+minute(?:s)?'
-            match = re.search(minute_only_pattern, message_lower)
+            # match just minutes "X minute(s)" (convert to seconds)
+            match = _MINUTE_ONLY_RE.search(message)
             if match:
                 minutes = int(match.group(1))
                 total_seconds = minutes * 60
@@ -836,37 +1725,54 @@ class EulerWebdriver:
             self.logger.error(f"Error parsing wait time from message: {e}")
             return None
 
-    def is_rate_limited(self) -> Tuple[bool, Optional[int]]:
+    def _page_text(self) -> str:
+        """
+        fetch the visible text of the current page
+        
+        innerText is much smaller than the serialized html and is all the
+        indicator checks look at
+        
+        returns:
+            str: Page text, empty if the page has no body yet
+        """
+        return self.driver.execute_script("return document.body ? document.body.innerText : '';") or ''
+    
+    def _get_page_text_lower(self) -> str:
+        """
+        fetch the current page text once, lowercased for indicator checks
+        
+        returns:
+            str: Lowercased page text
+        """
+        return self._page_text().lower()
+    
+    def is_rate_limited(self, page_text: Optional[str] = None) -> Tuple[bool, Optional[int]]:
         """
         check if currently rate limited and extract wait time if available
         
+        args:
+            page_text: Already fetched page text, fetched from the driver if None
+            
         returns:
             Tuple[bool, Optional[int]]: (is_rate_limited, wait_time_seconds)
         """
         try:
-            page_text = self.driver.page_source.lower()
-            rate_limit_indicators = [
-                'rate limit',
-                'too many',
-                'please wait',
-                'try again later',
-                'slow down',
-                'you must wait',
-                'before submitting any more answers'
-            ]
-            
-            for indicator in rate_limit_indicators:
-                if indicator in page_text:
-                    self.logger.warning("Rate limit detected")
-                    
-                    # try to extract wait time from the page content
-                    wait_time = self._parse_wait_time_from_message(page_text)
-                    if wait_time:
-                        self.logger.info(f"Extracted wait time: {wait_time} seconds")
-                        return True, wait_time
-                    else:
-                        self.logger.warning("Rate limit detected but could not parse wait time")
-                        return True, None
+            # the pattern is case-insensitive, so the raw text needs no lowercased copy
+            if page_text is None:
+                page_text = self._page_text()
+            
+            # single pass over the page for all indicators
+            if _RATE_LIMIT_RE.search(page_text):
+                self.logger.warning("Rate limit detected")
+                
+                # try to extract wait time from the page content
+                wait_time = self._parse_wait_time_from_message(page_text)
+                if wait_time:
+                    self.logger.info(f"Extracted wait time: {wait_time} seconds")
+                    return True, wait_time
+                else:
+                    self.logger.warning("Rate limit detected but could not parse wait time")
+                    return True, None
             
             return False, None
             
@@ -874,69 +1780,63 @@ class EulerWebdriver:
             self.logger.error(f"Error checking rate limit: {e}")
             return False, None
     
-    def wait_for_rate_limit(self, max_wait_time: int = 300) -> bool:
+    def wait_for_rate_limit(self, max_wait_time: int = 300, page_text: Optional[str] = None) -> bool:
         """
-        wait for rate limit to clear using precise timing based on extracted wait time
+        wait for rate limit to clear using exponential backoff with jitter,
+        jumping straight to the wait time from the page whenever one is given
         
         args:
-            max_wait_time: Maximum time to wait in seconds (fallback if no specific time found)
+            max_wait_time: Maximum total time to wait in seconds
+            page_text: Already fetched text of the current page, fetched if None
             
         returns:
             bool: True if rate limit cleared, False if timeout
         """
         try:
             # check current rate limit status and extract wait time
-            is_limited, wait_time = self.is_rate_limited()
+            is_limited, wait_time = self.is_rate_limited(page_text=page_text)
             
             if not is_limited:
                 self.logger.info("No rate limit detected")
                 return True
             
-            # determine how long to wait
-            if wait_time is not None:
-                # use the specific wait time from the error message
-                actual_wait_time = min(wait_time, max_wait_time)  # don't exceed max_wait_time
-                self.logger.info(f"Rate limit detected with specific wait time: {wait_time} seconds")
-                self.logger.info(f"Will wait for {actual_wait_time} seconds before refreshing...")
-            else:
-                # fallback to a reasonable default wait time
-                actual_wait_time = min(60, max_wait_time)  # Default to 1 minute or max_wait_time
-                self.logger.warning(f"Rate limit detected but no specific wait time found")
-                self.logger.info(f"Will wait for {actual_wait_time} seconds before refreshing...")
-            
-            # wait for the specified time with progress updates
-            self._wait_with_progress(actual_wait_time)
-            
-            # refresh the page after waiting
-            self.logger.info("Wait time completed, refreshing page...")
-            self.driver.refresh()
-            self._human_delay(2, 3)
-            
-            # check if rate limit is cleared
-            is_limited_after, _ = self.is_rate_limited()
-            if not is_limited_after:
-                self.logger.info("Rate limit cleared after timed wait and refresh!")
-                return True
-            else:
-                self.logger.warning("Still rate limited after timed wait, trying one more refresh...")
-                # one more refresh attempt
-                time.sleep(5)
+            deadline = time.monotonic() + max_wait_time
+            delay = 2.0
+            
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                # honor the site's own wait time, otherwise back off exponentially
+                if wait_time is not None:
+                    delay = float(wait_time)
+                    self.logger.info(f"Rate limit detected with specific wait time: {wait_time} seconds")
+                sleep_for = min(delay + random.uniform(0, delay * 0.25), remaining)
+                self.logger.info(f"Will wait for {sleep_for:.1f} seconds before refreshing...")
+                
+                # wait for the specified time with progress updates
+                self._wait_with_progress(sleep_for)
+                
+                # refresh the page after waiting
+                self.logger.info("Wait time completed, refreshing page...")
                 self.driver.refresh()
-                self._human_delay(2, 3)
                 
-                is_limited_final, _ = self.is_rate_limited()
-                if not is_limited_final:
-                    self.logger.info("Rate limit cleared after second refresh!")
+                is_limited, wait_time = self.is_rate_limited()
+                if not is_limited:
+                    self.logger.info("Rate limit cleared after timed wait and refresh!")
                     return True
-                else:
-                    self.logger.error("Still rate limited after multiple refreshes and timed wait")
-                    return False
+                
+                delay = min(delay * 2, 60)
+            
+            self.logger.error(f"Still rate limited after waiting {max_wait_time} seconds")
+            return False
                     
         except Exception as e:
             self.logger.error(f"Error handling rate limit: {e}")
             return False
 
-    def _wait_with_progress(self, wait_seconds: int) -> None:
+    def _wait_with_progress(self, wait_seconds: float) -> None:
         """
         Wait for specified seconds with progress updates
         
@@ -944,128 +1844,113 @@ class EulerWebdriver:
             wait_seconds: Number of seconds to wait
         """
         try:
-            # show progress updates every 10 seconds for waits longer than 30 seconds
-            if wait_seconds > 30:
-                update_interval = 10
-                remaining = wait_seconds
-                
-                while remaining > 0:
-                    if remaining <= update_interval:
-                        # final wait
-                        self.logger.info(f"Final wait: {remaining} seconds remaining...")
-                        time.sleep(remaining)
-                        break
-                    else:
-                        # wait for update interval
-                        self.logger.info(f"Rate limit wait: {remaining} seconds remaining...")
-                        time.sleep(update_interval)
-                        remaining -= update_interval
-            else:
+            if wait_seconds <= 30:
                 # for shorter waits, just wait without progress updates
-                self.logger.info(f"Waiting {wait_seconds} seconds for rate limit to clear...")
+                self.logger.info(f"Waiting {wait_seconds:.1f} seconds for rate limit to clear...")
                 time.sleep(wait_seconds)
+                return
+            
+            # long waits wake up every 30 seconds only to report progress
+            update_interval = 30
+            deadline = time.monotonic() + wait_seconds
+            remaining = wait_seconds
+            while remaining > 0:
+                self.logger.info(f"Rate limit wait: {remaining:.0f} seconds remaining...")
+                time.sleep(min(update_interval, remaining))
+                remaining = deadline - time.monotonic()
                 
         except Exception as e:
             self.logger.error(f"Error during wait: {e}")
             # fallback to simple sleep
             time.sleep(wait_seconds)
     
-    def _solve_captcha(self) -> Optional[str]:
+    def _debug_dump_images(self) -> None:
+        """log the first few images on the page to help find the captcha selector"""
+        try:
+            # count and first 10 rows in one round trip
+            total, images = self.driver.execute_script("""
+                const imgs = Array.from(document.images);
+                return [imgs.length, imgs.slice(0, 10).map(i => [
+                    i.id || 'no id', i.className || 'no class', i.alt || 'no alt',
+                    (i.getAttribute('src') || 'no src').slice(0, 100)
+                ])];
+            """)
+            self.logger.debug(f"Found {total} total images on page:")
+            for i, (img_id, img_class, img_alt, src) in enumerate(images):
+                self.logger.debug(f"  Image {i+1}: id='{img_id}', class='{img_class}', alt='{img_alt}', src='{src}...'")
+        except Exception as e:
+            self.logger.error(f"Error debugging page images: {e}")
+    
+    def _solve_captcha(self, captcha_img=None) -> Optional[str]:
         """
         solve captcha using automated OpenAI API with fallback to manual input
         
+        args:
+            captcha_img: Already located captcha image, looked up if None
+            
         returns:
             Optional[str]: Captcha solution or None if failed
         """
         try:
-            captcha_img = None
-            try:
-                captcha_img = self.driver.find_element(By.ID, "captcha_image")
-                self.logger.info("Found captcha image using id='captcha_image'")
-            except NoSuchElementException:
-                self.logger.info("No captcha image found with id='captcha_image', trying fallback selectors...")
-                # fallback to other selectors
-                captcha_selectors = [
-                    "//img[contains(@id, 'captcha')]",
-                    "//img[contains(@src, 'captcha')]",
-                    "//img[contains(@alt, 'captcha')]",
-                    "//img[contains(@class, 'captcha')]"
-                ]
-                
-                for selector in captcha_selectors:
-                    try:
-                        captcha_img = self.driver.find_element(By.XPATH, selector)
-                        self.logger.info(f"Found captcha image using selector: {selector}")
-                        break
-                    except NoSuchElementException:
-                        continue
-                if not captcha_img:
-                    self.logger.info("No captcha image found with any selector, debugging page images...")
-                    try:
-                        all_images = self.driver.find_elements(By.TAG_NAME, "img")
-                        self.logger.info(f"Found {len(all_images)} total images on page:")
-                        for i, img in enumerate(all_images[:10]):  # show first 10
-                            try:
-                                src = img.get_attribute('src') or 'no src'
-                                img_id = img.get_attribute('id') or 'no id'
-                                img_class = img.get_attribute('class') or 'no class'
-                                img_alt = img.get_attribute('alt') or 'no alt'
-                                self.logger.info(f"  Image {i+1}: id='{img_id}', class='{img_class}', alt='{img_alt}', src='{src[:100]}...'")
-                            except Exception as e:
-                                self.logger.info(f"  Image {i+1}: Error getting attributes: {e}")
-                    except Exception as e:
-                        self.logger.error(f"Error debugging page images: {e}")
-            
-            # verify we found the right element
-            if captcha_img:
+            if captcha_img is None:
+                captcha_images = self.driver.find_elements(By.CSS_SELECTOR, _CAPTCHA_IMG_CSS)
+                captcha_img = captcha_images[0] if captcha_images else None
+            if not captcha_img:
+                self.logger.warning("No captcha image found")
+                # the page listing costs a round trip per attribute, so only pay it when debugging
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self._debug_dump_images()
+                return None
+            
+            self.logger.info("Found captcha image")
+            
+            # element details cost a round trip and several log lines, only worth it when debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
                 try:
-                    # get element details for verification
-                    element_id = captcha_img.get_attribute('id') or 'no id'
-                    element_class = captcha_img.get_attribute('class') or 'no class'
-                    element_src = captcha_img.get_attribute('src') or 'no src'
-                    element_size = captcha_img.size
-                    element_location = captcha_img.location
-                    
-                    self.logger.info(f"Captcha element details:")
-                    self.logger.info(f"  ID: {element_id}")
-                    self.logger.info(f"  Class: {element_class}")
-                    self.logger.info(f"  Src: {element_src[:100]}...")
-                    self.logger.info(f"  Size: {element_size}")
-                    self.logger.info(f"  Location: {element_location}")
+                    # get element details for verification in a single round trip
+                    element_id, element_class, element_src, rect, is_displayed = self.driver.execute_script("""
+                        const e = arguments[0];
+                        const r = e.getBoundingClientRect();
+                        return [e.id || 'no id', e.className || 'no class', e.getAttribute('src') || 'no src',
+                                [r.width, r.height, r.x, r.y], e.offsetParent !== null];
+                    """, captcha_img)
                     
-                    # check if element is visible
-                    is_displayed = captcha_img.is_displayed()
-                    self.logger.info(f"  Is displayed: {is_displayed}")
+                    self.logger.debug(f"Captcha element details:")
+                    self.logger.debug(f"  ID: {element_id}")
+                    self.logger.debug(f"  Class: {element_class}")
+                    self.logger.debug(f"  Src: {element_src[:100]}...")
+                    self.logger.debug(f"  Size: {{'width': {rect[0]}, 'height': {rect[1]}}}")
+                    self.logger.debug(f"  Location: {{'x': {rect[2]}, 'y': {rect[3]}}}")
+                    self.logger.debug(f"  Is displayed: {is_displayed}")
                     
                 except Exception as e:
                     self.logger.warning(f"Could not get captcha element details: {e}")
             
-            if not captcha_img:
-                self.logger.warning("No captcha image found")
-                return None
-            
             self.logger.info("Captcha detected, attempting to solve...")
             self.logger.info("Capturing currently displayed captcha using screenshot method...")
-            image_path = self._screenshot_captcha_element(captcha_img)
-            if not image_path:
+            image_bytes = self._screenshot_captcha_element(captcha_img)
+            if not image_bytes:
                 self.logger.error("Failed to capture captcha image using screenshot method")
                 return None
             
             # try to solve with OpenAI API
-            solution = self._solve_captcha_with_openai(image_path)
+            solution = self._solve_captcha_with_openai(image_bytes)
             if solution:
                 self.logger.info(f"Successfully solved captcha with OpenAI: {solution}")
-                # delete the captcha image immediately after solving
-                self._delete_captcha_image(image_path)
                 return solution
             
-            # fallback to manual input
+            # fallback to manual input, which needs the image on disk to look at
             self.logger.warning("OpenAI captcha solving failed, falling back to manual input")
-            self.logger.info(f"Captured captcha image saved at: {image_path}")
-            captcha_text = input("Enter captcha: ").strip()
-            
-            # delete the captcha image after manual input (regardless of success)
-            self._delete_captcha_image(image_path)
+            image_path = self._save_captcha_image(image_bytes)
+            if image_path:
+                self.logger.info(f"Captured captcha image saved at: {image_path}")
+            captcha_text = _timed_input("Enter captcha: ", self.manual_captcha_timeout)
+            if captcha_text is None:
+                self.logger.warning(f"No captcha entered within {self.manual_captcha_timeout} seconds, skipping")
+            
+            # delete the captcha image after manual input unless it is being kept for debugging
+            if image_path and not self.debug_captcha:
+                self._delete_captcha_image(image_path)
             
             return captcha_text if captcha_text else None
                 
@@ -1086,21 +1971,14 @@ class EulerWebdriver:
         try:
             for attempt in range(max_retries):
                 
-                # look for captcha input field
-                captcha_input_selectors = [
-                    "//input[contains(@name, 'captcha')]",
-                    "//input[contains(@id, 'captcha')]",
-                    "//input[contains(@class, 'captcha')]",
-                    "//input[@type='text'][following-sibling::img or preceding-sibling::img]"
-                ]
-                
-                captcha_input = None
-                for selector in captcha_input_selectors:
-                    try:
-                        captcha_input = self.driver.find_element(By.XPATH, selector)
-                        break
-                    except NoSuchElementException:
-                        continue
+                # look for captcha input field (named inputs before the generic text-beside-image
+                # fallback), locating the image in the same round trip
+                captcha_input, captcha_img = self.driver.execute_script("""
+                    const first = xpath => document.evaluate(xpath, document, null,
+                        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                    const input = first(arguments[0]) || first(arguments[1]);
+                    return [input, input ? document.querySelector(arguments[2]) : null];
+                """, _CAPTCHA_INPUT_XPATH, _CAPTCHA_INPUT_FALLBACK_XPATH, _CAPTCHA_IMG_CSS)
                 
                 if not captcha_input:
                     # no captcha present
@@ -1108,16 +1986,13 @@ class EulerWebdriver:
                     return True
                 
                 # solve the captcha
-                captcha_solution = self._solve_captcha()
+                captcha_solution = self._solve_captcha(captcha_img)
                 if not captcha_solution:
                     if attempt < max_retries - 1:
                         continue
                     return False
                 
-                # clear and enter the captcha solution
-                captcha_input.clear()
-                self._human_delay(0.1, 0.2)
-                
+                # enter the captcha solution (_safe_send_keys clears the field first)
                 if not self._safe_send_keys(captcha_input, captcha_solution):
                     if attempt < max_retries - 1:
                         continue
@@ -1129,4 +2004,105 @@ class EulerWebdriver:
             
         except Exception as e:
             self.logger.error(f"Error handling captcha: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+class EulerDriverPool:
+    """fixed set of logged-in webdrivers shared by worker threads"""
+    
+    def __init__(self, size: int = 2, **driver_kwargs):
+        """
+        initialize the pool
+        
+        args:
+            size: Number of browser instances to run
+            **driver_kwargs: Settings passed to every EulerWebdriver
+        """
+        self.size = max(1, size)
+        self.driver_kwargs = driver_kwargs
+        self.logger = _logger
+        self._drivers: List[EulerWebdriver] = []
+        self._idle: queue.Queue = queue.Queue()
+    
+    def start(self) -> bool:
+        """
+        start and log in every driver in the pool
+        
+        returns:
+            bool: True if at least one driver is ready
+        """
+        for i in range(self.size):
+            # browsers can't share a profile directory, so each one gets its own;
+            # the first reuses the single-browser profile and its saved session
+            kwargs = dict(self.driver_kwargs)
+            profile = "brave_profile" if i == 0 else f"brave_profile_{i + 1}"
+            kwargs['profile_dir'] = os.path.join(os.getcwd(), profile)
+            driver = EulerWebdriver(**kwargs)
+            try:
+                driver.start()
+                if not driver.login():
+                    self.logger.error(f"Pool driver {i + 1} failed to login")
+                    driver.stop()
+                    continue
+            except Exception as e:
+                self.logger.error(f"Failed to start pool driver {i + 1}: {e}")
+                driver.stop()
+                continue
+            
+            self._drivers.append(driver)
+            self._idle.put(driver)
+        
+        self.logger.info(f"Driver pool ready with {len(self._drivers)}/{self.size} drivers")
+        return bool(self._drivers)
+    
+    @property
+    def size_ready(self) -> int:
+        """Number of drivers that started and logged in"""
+        return len(self._drivers)
+    
+    def stop(self) -> None:
+        """Stop every driver in the pool"""
+        for driver in self._drivers:
+            driver.stop()
+        self._drivers.clear()
+        self._idle = queue.Queue()
+    
+    @contextmanager
+    def acquire(self):
+        """borrow an idle driver, returning it to the pool afterwards"""
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+    
+    def run_on_each(self, worker_fn: Callable[[EulerWebdriver], Any]) -> List[Any]:
+        """
+        run worker_fn once on every ready driver, all at the same time
+        
+        args:
+            worker_fn: Called as worker_fn(driver), typically looping over shared work
+            
+        returns:
+            List[Any]: Each call's result (None if it raised)
+        """
+        def run(_) -> Any:
+            with self.acquire() as driver:
+                try:
+                    return worker_fn(driver)
+                except Exception as e:
+                    self.logger.error(f"Pool worker failed: {e}")
+                    return None
+        
+        workers = max(1, len(self._drivers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, range(workers)))
+    
+    def __enter__(self):
+        """Context manager entry"""
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.stop()
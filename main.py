@@ -3,12 +3,131 @@ eulerdriver
 automates solution to Project Euler
 """
 import os
+import re
 import sys
 import time
+import queue
+import threading
+import atexit
+import argparse
 import logging
-from typing import List, Dict, Optional
+import logging.handlers
+from collections import deque
+from typing import Dict, Iterable, Optional, Set
 
-from euler_webdriver import EulerWebdriver
+from euler_webdriver import EulerWebdriver, EulerDriverPool
+
+# problem number, then ".", ":" or whitespace, then the answer (decimal answers keep their dot)
+_ANSWER_LINE_RE = re.compile(r'(\d+)\s*(?:[.:]\s*|\s+)(.*)')
+
+# answers that mean "not known yet" (empty answers are caught before the lookup)
+_PLACEHOLDER_ANSWERS = frozenset({'blank', 'unknown', '?'})
+
+# background writer for the solver log, started by the first EulerSolver
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _setup_logging() -> None:
+    """route logging to the log file and console through a queue, once per process"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    # the file and console writes happen on a background listener so logging never blocks the solver
+    log_queue: queue.Queue = queue.Queue(-1)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('euler_solver.log')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # drains anything still queued
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+
+class _SolveQueue:
+    """problems left to try in a run, shared by every browser working on it"""
+    
+    def __init__(self, problems: Iterable[int], max_attempts: int = 3,
+                 max_consecutive_failures: int = 5, failure_break: float = 60.0):
+        """queue problems in order with the retry and failure break limits"""
+        self.todo = deque(problems)
+        self.max_attempts = max_attempts
+        self.max_consecutive_failures = max_consecutive_failures
+        self.failure_break = failure_break
+        
+        self.solved = 0
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.attempts: Dict[int, int] = {}
+        self._resume_at = 0.0
+        self._cond = threading.Condition()
+        self.logger = logging.getLogger(__name__)
+    
+    def take(self, max_problems: Optional[int] = None) -> Optional[int]:
+        """
+        next problem to try, or None once the queue is done
+        
+        args:
+            max_problems: Stop once this many problems are solved
+            
+        returns:
+            Optional[int]: Problem number, after waiting out any failure break
+        """
+        with self._cond:
+            while True:
+                if max_problems and self.solved >= max_problems:
+                    return None
+                
+                # an attempt still running may fail and be queued again, as may one
+                # that would take the run past max_problems
+                if not self.todo or (max_problems and self.solved + self.in_flight >= max_problems):
+                    if not self.in_flight:
+                        return None
+                    self._cond.wait()
+                    continue
+                
+                pause = self._resume_at - time.monotonic()
+                if pause > 0:
+                    self._cond.wait(pause)
+                    continue
+                
+                problem_num = self.todo.popleft()
+                self.attempts[problem_num] = self.attempts.get(problem_num, 0) + 1
+                self.in_flight += 1
+                return problem_num
+    
+    def finish(self, problem_num: int, success: bool, retry: bool) -> None:
+        """
+        record the outcome of an attempt taken with take()
+        
+        args:
+            problem_num: The problem that was attempted
+            success: Whether it was solved
+            retry: Whether a failure is worth another attempt
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if success:
+                self.solved += 1
+                self.consecutive_failures = 0
+                self.logger.info(f"Progress: {self.solved} problems solved")
+            else:
+                self.consecutive_failures += 1
+                self.logger.warning(f"Consecutive failures: {self.consecutive_failures}")
+                
+                if retry and self.attempts[problem_num] < self.max_attempts:
+                    self.todo.appendleft(problem_num)
+                
+                # take a break if too many failures
+                if self.consecutive_failures >= self.max_consecutive_failures:
+                    self.logger.warning("Too many consecutive failures, taking a longer break...")
+                    self._resume_at = time.monotonic() + self.failure_break
+                    self.consecutive_failures = 0
+            self._cond.notify_all()
 
 class EulerSolver:
     """main solving workflow"""
@@ -17,18 +136,16 @@ class EulerSolver:
         """initialize with answers file path"""
         self.answers_file = answers_file
         self.answers: Dict[int, str] = {}
-        self.solved_problems: List[int] = []
-        self.failed_problems: List[int] = []
+        self.solved_problems: Set[int] = set()
+        self.failed_problems: Set[int] = set()
         
-        # setup logging to both file and console
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('euler_solver.log'),
-                logging.StreamHandler()
-            ]
-        )
+        # pause between problems, shortened on success and doubled when rate limited
+        self.min_delay = 0.5
+        self.max_delay = 60.0
+        self._delay = self.min_delay
+        
+        # setup logging to both file and console (once per process)
+        _setup_logging()
         self.logger = logging.getLogger(__name__)
     
     def load_answers(self) -> bool:
@@ -41,39 +158,26 @@ class EulerSolver:
             self.logger.info(f"Loading answers from '{self.answers_file}'...")
             
             with open(self.answers_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                try:
-                    # parse different formats: "1. 200", "1: 200", "1 200"
-                    if '.' in line:
-                        parts = line.split('.', 1)
-                    elif ':' in line:
-                        parts = line.split(':', 1)
-                    else:
-                        parts = line.split(None, 1)
+                for line_num, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
                     
-                    if len(parts) != 2:
+                    # parse different formats: "1. 200", "1: 200", "1 200"
+                    match = _ANSWER_LINE_RE.match(line)
+                    if not match:
                         self.logger.warning(f"Invalid format on line {line_num}: {line}")
                         continue
                     
-                    problem_num = int(parts[0].strip())
-                    answer = parts[1].strip()
+                    problem_num = int(match.group(1))
+                    answer = match.group(2)
                     
                     # skip empty or placeholder answers
-                    if not answer or answer.lower() in ['', 'blank', 'unknown', '?']:
+                    if not answer or answer.lower() in _PLACEHOLDER_ANSWERS:
                         self.logger.info(f"Skipping problem {problem_num} - blank answer")
                         continue
                     
                     self.answers[problem_num] = answer
-                    
-                except ValueError:
-                    self.logger.warning(f"Invalid format on line {line_num}: {line}")
-                    continue
             
             self.logger.info(f"Loaded {len(self.answers)} answers")
             return True
@@ -98,8 +202,9 @@ class EulerSolver:
                 self.logger.error(f"Failed to navigate to problem {problem_num}")
                 return False
             
-            # check for rate limiting
-            if webdriver.is_rate_limited():
+            # check for rate limiting (is_rate_limited returns a (limited, wait_time) tuple)
+            is_limited, _ = webdriver.is_rate_limited()
+            if is_limited:
                 self.logger.warning("Rate limited before submission, waiting...")
                 if not webdriver.wait_for_rate_limit():
                     self.logger.error("Rate limit wait timeout")
@@ -117,18 +222,19 @@ class EulerSolver:
             
             if 'correct' in result_lower and 'congratulations' in result_lower:
                 self.logger.info(f"Problem {problem_num} solved successfully!")
-                self.solved_problems.append(problem_num)
+                self.solved_problems.add(problem_num)
                 return True
             elif 'incorrect' in result_lower:
                 self.logger.warning(f"Problem {problem_num} - incorrect answer: {result_message}")
-                self.failed_problems.append(problem_num)
+                self.failed_problems.add(problem_num)
                 return False
             elif 'already solved' in result_lower:
                 self.logger.info(f"Problem {problem_num} already solved")
-                self.solved_problems.append(problem_num)
+                self.solved_problems.add(problem_num)
                 return True
             elif 'rate limit' in result_lower:
                 self.logger.warning(f"Problem {problem_num} - rate limited: {result_message}")
+                self._delay = min(self.max_delay, self._delay * 2)
                 return False  # Don't mark as failed, retry later
             else:
                 self.logger.warning(f"Problem {problem_num} - unknown result: {result_message}")
@@ -138,7 +244,7 @@ class EulerSolver:
             self.logger.error(f"Error solving problem {problem_num}: {e}")
             return False
     
-    def run(self, headless: bool = False, max_problems: Optional[int] = None) -> None:
+    def run(self, headless: bool = False, max_problems: Optional[int] = None, workers: int = 1) -> None:
         """run the main solving process"""
         try:
             # Load answers first
@@ -146,64 +252,31 @@ class EulerSolver:
                 self.logger.error("Failed to load answers, exiting")
                 return
             
-            # initialize webdriver
-            with EulerWebdriver(headless=headless) as webdriver:
-                # login if needed
-                if not webdriver.check_login_status():
-                    self.logger.info("Not logged in, attempting to login...")
-                    if not webdriver.login():
-                        self.logger.error("Failed to login, exiting")
-                        return
-                else:
-                    self.logger.info("Already logged in")
-                
-                # main solving loop
-                problems_solved = 0
-                consecutive_failures = 0
-                max_consecutive_failures = 5
-                
-                while True:
-                    # check limits
-                    if max_problems and problems_solved >= max_problems:
-                        self.logger.info(f"Reached maximum problems limit ({max_problems})")
-                        break
-                    
-                    # get next unsolved problem
-                    problem_num = webdriver.get_next_unsolved_problem()
-                    if not problem_num:
-                        self.logger.info("No more unsolved problems found")
-                        break
-                    
-                    # check if we have an answer
-                    if problem_num not in self.answers:
-                        self.logger.info(f"No answer available for problem {problem_num}, skipping...")
-                        continue
-                    
-                    self.logger.info(f"Found unsolved problem {problem_num} with available answer")
-                    
-                    # solve the problem
-                    success = self.solve_problem(webdriver, problem_num)
-                    
-                    if success:
-                        problems_solved += 1
-                        consecutive_failures = 0
-                        self.logger.info(f"Progress: {problems_solved} problems solved")
-                    else:
-                        consecutive_failures += 1
-                        self.logger.warning(f"Consecutive failures: {consecutive_failures}")
-                        
-                        # take a break if too many failures
-                        if consecutive_failures >= max_consecutive_failures:
-                            self.logger.warning("Too many consecutive failures, taking a longer break...")
-                            time.sleep(60)
-                            consecutive_failures = 0
-                    
-                    # small delay between problems
-                    time.sleep(2)
-                
-                # show final summary
-                self.print_summary()
-                
+            if workers > 1:
+                self._run_parallel(headless, max_problems, workers)
+                return
+            
+            # reuse the process-wide browser, so calling run() again doesn't relaunch it;
+            # it is closed when the process exits
+            webdriver = EulerWebdriver.shared(headless=headless)
+            
+            # login if needed; login() reuses a remembered session from the browser
+            # profile before touching the sign in form
+            if not webdriver.login():
+                self.logger.error("Failed to login, exiting")
+                return
+            
+            # main solving loop over every unsolved problem we have an answer for,
+            # taken from a single progress page fetch
+            work = _SolveQueue(p for p in webdriver.get_unsolved_problems() if p in self.answers)
+            self.logger.info(f"{len(work.todo)} unsolved problems have answers available")
+            
+            self._work_through(webdriver, work, max_problems)
+            self._log_run_end(work, max_problems)
+            
+            # show final summary
+            self.print_summary()
+            
         except KeyboardInterrupt:
             self.logger.info("Interrupted by user")
             self.print_summary()
@@ -211,6 +284,54 @@ class EulerSolver:
             self.logger.error(f"Unexpected error: {e}")
             self.print_summary()
     
+    def _run_parallel(self, headless: bool, max_problems: Optional[int], workers: int) -> None:
+        """solve problems on a pool of logged-in browsers, one problem per browser at a time"""
+        # the pool's first browser opens the same profile as the shared one
+        EulerWebdriver.close_shared()
+        
+        with EulerDriverPool(size=workers, headless=headless) as pool:
+            if not pool.size_ready:
+                self.logger.error("Failed to start any logged-in browser, exiting")
+                return
+            
+            with pool.acquire() as webdriver:
+                work = _SolveQueue(p for p in webdriver.get_unsolved_problems() if p in self.answers)
+            self.logger.info(f"Solving {len(work.todo)} problems with {pool.size_ready} browsers")
+            
+            # every browser pulls from the same queue, so retries, the solved limit and
+            # failure breaks behave as in a single-browser run
+            pool.run_on_each(lambda webdriver: self._work_through(webdriver, work, max_problems))
+            self._log_run_end(work, max_problems)
+        
+        # show final summary
+        self.print_summary()
+    
+    def _work_through(self, webdriver: EulerWebdriver, work: '_SolveQueue', max_problems: Optional[int]) -> None:
+        """solve problems from work on one browser until the queue is done"""
+        while True:
+            problem_num = work.take(max_problems)
+            if problem_num is None:
+                return
+            self.logger.info(f"Found unsolved problem {problem_num} with available answer")
+            
+            # solve the problem
+            success = self.solve_problem(webdriver, problem_num)
+            if success:
+                self._delay = max(self.min_delay, self._delay * 0.7)
+            
+            # wrong answers won't improve, anything else (rate limits, page errors) gets another go
+            work.finish(problem_num, success, retry=problem_num not in self.failed_problems)
+            
+            # adaptive delay between problems
+            time.sleep(self._delay)
+    
+    def _log_run_end(self, work: '_SolveQueue', max_problems: Optional[int]) -> None:
+        """log why a run stopped"""
+        if max_problems and work.solved >= max_problems:
+            self.logger.info(f"Reached maximum problems limit ({max_problems})")
+        elif not work.todo:
+            self.logger.info("No more unsolved problems found")
+    
     def print_summary(self) -> None:
         """print session summary"""
         self.logger.info("=" * 50)
@@ -230,8 +351,6 @@ class EulerSolver:
 
 def main():
     """main entry point"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="Project Euler Problem Solver")
     parser.add_argument("--answers", "-a", default="answers.txt", 
                        help="Path to answers file (default: answers.txt)")
@@ -239,18 +358,22 @@ def main():
                        help="Run in headless mode")
     parser.add_argument("--max-problems", "-m", type=int, 
                        help="Maximum number of problems to solve")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                       help="Number of browsers solving in parallel (default: 1)")
     
     args = parser.parse_args()
     
-    # check for environment file
+    # check for environment file (logged so it also lands in euler_solver.log)
+    _setup_logging()
+    logger = logging.getLogger(__name__)
     if not os.path.exists('.env'):
-        print("Error: .env file not found!")
-        print("Please copy env_example.txt to .env and fill in your credentials.")
+        logger.error(".env file not found!")
+        logger.error("Please copy env_example.txt to .env and fill in your credentials.")
         sys.exit(1)
     
     # create and run solver
     solver = EulerSolver(args.answers)
-    solver.run(headless=args.headless, max_problems=args.max_problems)
+    solver.run(headless=args.headless, max_problems=args.max_problems, workers=args.workers)
 
 if __name__ == "__main__":
     main()